@@ -4,10 +4,12 @@ from pycaw.constants import DEVICE_STATE, EDataFlow
 from pycaw.pycaw import AudioUtilities
 from pycaw.utils import AudioDevice
 
+_IS_WINDOWS = platform.system() == "Windows"
+
 
 def get_audio_devices():
     """Get available audio output devices (Windows only)"""
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return None
 
     try:
@@ -24,7 +26,7 @@ def get_audio_devices():
 
 def get_current_device():
     """Get the currently active audio output device"""
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return None
 
     try:
@@ -42,22 +44,13 @@ def set_audio_device(device):
     Returns:
         bool: True if successful, False otherwise
     """
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return False
 
     try:
         # If device is a string (name), find the matching AudioDevice
         if isinstance(device, str):
-            devices = get_audio_devices()
-            if not devices:
-                return False
-
-            device_obj = None
-            for d in devices:
-                if d.FriendlyName == device:
-                    device_obj = d
-                    break
-
+            device_obj = get_devices_by_name().get(device)
             if not device_obj:
                 return False
 
@@ -76,7 +69,7 @@ def cycle_audio_device():
     Returns:
         bool: True if successful, False otherwise
     """
-    if platform.system() != "Windows":
+    if not _IS_WINDOWS:
         return False
 
     try:
@@ -115,4 +108,21 @@ def get_device_names():
     if not devices:
         return []
 
-    return [device.FriendlyName for device in devices]
\ No newline at end of file
+    return [device.FriendlyName for device in devices]
+
+
+def get_devices_by_name():
+    """Get output devices keyed by name, from a single enumeration
+
+    Returns:
+        dict: Device name -> AudioDevice (first device wins for duplicate
+            names), or empty dict if unavailable
+    """
+    devices = get_audio_devices()
+    if not devices:
+        return {}
+
+    devices_by_name = {}
+    for device in devices:
+        devices_by_name.setdefault(device.FriendlyName, device)
+    return devices_by_name
\ No newline at end of file
@@ -373,20 +373,22 @@ class WindowsAudioDriver(AudioDriver):
         return False
 
     def toggle_master_mute(self):
-        if not self.master_volume: return False
+        # Read the endpoint once; refresh_audio_devices may replace it mid-toggle
+        endpoint = self.master_volume
+        if not endpoint: return False
         try:
-            current = self.master_volume.GetMute()
-            self.master_volume.SetMute(not current, None)
+            endpoint.SetMute(not endpoint.GetMute(), None)
             return True
         except Exception as e:
             log_error(e, "Error toggling master mute")
             return False
 
     def toggle_mic_mute(self):
-        if not self.mic_volume: return False
+        # Read the endpoint once; refresh_audio_devices may replace it mid-toggle
+        endpoint = self.mic_volume
+        if not endpoint: return False
         try:
-            current = self.mic_volume.GetMute()
-            self.mic_volume.SetMute(not current, None)
+            endpoint.SetMute(not endpoint.GetMute(), None)
             return True
         except Exception as e:
             log_error(e, "Error toggling mic mute")
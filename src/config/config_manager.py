@@ -9,6 +9,10 @@ from typing import Optional
 from utils.error_handler import log_error
 
 
+# Accepted values for the ``slider_sampling`` config key.
+_VALID_SLIDER_SAMPLING = frozenset(('instant', 'responsive', 'soft', 'normal', 'hard'))
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -406,9 +410,8 @@ class ConfigManager:
 
     def set_slider_sampling(self, mode: str) -> bool:
         """Set the global volume control mode for all bindings"""
-        valid_modes = {'instant', 'responsive', 'soft', 'normal', 'hard'}
         mode = (mode.lower() if mode else 'normal')
-        if mode not in valid_modes:
+        if mode not in _VALID_SLIDER_SAMPLING:
             mode = 'normal'
 
         with self._lock:
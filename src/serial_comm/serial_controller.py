@@ -32,6 +32,7 @@ class SerialController:
         """Start processing events and listening to serial"""
         if self.serial_handler:
             self.serial_handler.add_callback(self._handle_serial_data)
+        self.action_handler.prefetch_audio_cmdlets_check()
         print("SerialController started")
 
     def stop(self):
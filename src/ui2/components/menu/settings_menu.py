@@ -8,6 +8,15 @@ from ui2 import colors
 from ui2.settings_manager import settings_manager
 from utils import system_startup
 
+# (label, config value) pairs shown under "Slider Sampling", in menu order
+SAMPLING_MODES = (
+    ("Instant", "instant"),
+    ("Responsive", "responsive"),
+    ("Soft", "soft"),
+    ("Normal", "normal"),
+    ("Hard", "hard"),
+)
+
 class SettingsMenu:
     def __init__(self, menu_builder):
         self.menu_builder = menu_builder
@@ -34,18 +43,16 @@ class SettingsMenu:
         
         current_sampling = settings_manager.get_slider_sampling()
         
-        instant_item = self.menu_builder.add_item("Instant", level=1, selected=(current_sampling == "instant"))
-        responsive_item = self.menu_builder.add_item("Responsive", level=1, selected=(current_sampling == "responsive"))
-        soft_item = self.menu_builder.add_item("Soft", level=1, selected=(current_sampling == "soft"))
-        normal_item = self.menu_builder.add_item("Normal", level=1, selected=(current_sampling == "normal"))
-        hard_item = self.menu_builder.add_item("Hard", level=1, selected=(current_sampling == "hard"))
+        # Build the mode items into one local list up front; each click
+        # handler shares it instead of capturing its own list of siblings.
+        sampling_items = [
+            self.menu_builder.add_item(label, level=1, selected=(current_sampling == mode))
+            for label, mode in SAMPLING_MODES
+        ]
         
         # Connect callbacks
-        instant_item.clicked.connect(lambda: self._set_sampling("instant", instant_item, [responsive_item, soft_item, normal_item, hard_item]))
-        responsive_item.clicked.connect(lambda: self._set_sampling("responsive", responsive_item, [instant_item, soft_item, normal_item, hard_item]))
-        soft_item.clicked.connect(lambda: self._set_sampling("soft", soft_item, [instant_item, responsive_item, normal_item, hard_item]))
-        normal_item.clicked.connect(lambda: self._set_sampling("normal", normal_item, [instant_item, responsive_item, soft_item, hard_item]))
-        hard_item.clicked.connect(lambda: self._set_sampling("hard", hard_item, [instant_item, responsive_item, soft_item, normal_item]))
+        for (_, mode), item in zip(SAMPLING_MODES, sampling_items):
+            item.clicked.connect(lambda m=mode, it=item: self._set_sampling(m, it, sampling_items))
         
         # Layout section — collapsible, starts expanded
         self.menu_builder.add_head("Layout", expandable=True, expanded=True)
@@ -177,7 +184,8 @@ class SettingsMenu:
         settings_manager.set_slider_sampling(mode)
         selected_item.set_selected(True)
         for item in other_items:
-            item.set_selected(False)
+            if item is not selected_item:
+                item.set_selected(False)
             
         if self.menu_builder.audio_manager:
             self.menu_builder.audio_manager.set_slider_sampling(mode)
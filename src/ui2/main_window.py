@@ -583,8 +583,9 @@ class MainWindow(QMainWindow):
                         row.append("empty")
                     c += 1
                 button_matrix.append(row)
-            settings_manager.set_button_matrix(button_matrix)
-            settings_manager.set_grid_dimensions(rows, cols)
+            with settings_manager.batch():
+                settings_manager.set_button_matrix(button_matrix)
+                settings_manager.set_grid_dimensions(rows, cols)
             
         # Flatten matrix to create buttons list
         flat_order = []
@@ -1072,7 +1073,6 @@ class MainWindow(QMainWindow):
         # Save Slider Order (List of IDs)
         # We need stable IDs. Let's use `slider.id` which we set at creation.
         slider_ids = [s.id for s in self.sliders]
-        settings_manager.set_slider_order(slider_ids)
         
         # Save Button Matrix
         # Based on current Grid Size
@@ -1105,8 +1105,11 @@ class MainWindow(QMainWindow):
                     row_list.append("empty") # or None
             matrix.append(row_list)
             
-        settings_manager.set_button_matrix(matrix)
-        settings_manager.set_grid_dimensions(rows, cols)
+        # Write all three fields with a single save
+        with settings_manager.batch():
+            settings_manager.set_slider_order(slider_ids)
+            settings_manager.set_button_matrix(matrix)
+            settings_manager.set_grid_dimensions(rows, cols)
 
 
     def update_button_grid(self, dimensions: tuple[int, int] = None):
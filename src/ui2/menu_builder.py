@@ -5,11 +5,10 @@ Coordinator for specialized menu components.
 
 import sys
 import os
-import re
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from ui2.components.menu_item import MenuItem
 from ui2.components.section_header import SectionHeader
 from ui2 import colors, fonts
@@ -17,9 +16,7 @@ from ui2.components.input_item import InputItem
 from ui2.components.browse_item import BrowseItem
 from ui2.settings_manager import settings_manager
 from ui2.icon_manager import icon_manager 
-from utils import system_startup
 from PySide6.QtWidgets import QFileDialog, QMenu
-from PySide6.QtGui import QAction, QCursor
 
 # Import separate menu components
 from ui2.components.menu.settings_menu import SettingsMenu
@@ -28,11 +25,18 @@ from ui2.components.menu.button_menu import ButtonMenu
 from ui2.components.menu.screen_menu import ScreenMenu
 from ui2.components.menu.led_settings_menu import LedSettingsMenu
 
-try:
-    import win32com.client
-except ImportError:
-    win32com = None
-
+# Separator drawn above each section head. BACKGROUND is a fixed theme
+# colour (only the accent is dynamic), so the QSS is built once at import.
+_SECTION_SEPARATOR_QSS = f"""
+    QFrame {{
+        background-color: {colors.BACKGROUND};
+        border: none;
+        min-height: 1px;
+        max-height: 1px;
+        margin-top: 0px;
+        margin-bottom: 5px;
+    }}
+"""
 
 
 class MenuBuilder:
@@ -85,16 +89,7 @@ class MenuBuilder:
         if self.content_layout.count() > 0:
             line = QFrame()
             line.setFrameShape(QFrame.HLine)
-            line.setStyleSheet(f"""
-                QFrame {{
-                    background-color: {colors.BACKGROUND};
-                    border: none;
-                    min-height: 1px;
-                    max-height: 1px;
-                    margin-top: 0px;
-                    margin-bottom: 5px;
-                }}
-            """)
+            line.setStyleSheet(_SECTION_SEPARATOR_QSS)
             self.content_layout.addWidget(line)
         
         # Create section header
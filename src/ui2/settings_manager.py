@@ -1,78 +1,165 @@
-import os
-import sys
-
-# Add project root to path to ensure imports work
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
 
 from config.config_manager import ConfigManager
 
+_VALID_BUTTON_ALIGNMENTS = frozenset(("vertical", "horizontal"))
+
+# Shared read-only stand-in for a missing 'button_bindings' section
+_NO_BUTTON_BINDINGS = MappingProxyType({})
+
+# Config keys for physical positions (index 0 -> "s1" / "b1"), precomputed
+# so positional lookups don't format a new string on every call.
+_SLIDER_KEYS = tuple(f"s{i + 1}" for i in range(64))
+_BUTTON_KEYS = tuple(f"b{i + 1}" for i in range(64))
+
+
+def _slider_key(index: int) -> str:
+    """Config key for the slider at physical *index*."""
+    if 0 <= index < len(_SLIDER_KEYS):
+        return _SLIDER_KEYS[index]
+    return f"s{index + 1}"
+
+
+def _button_key(index: int) -> str:
+    """Config key for the button at physical *index*."""
+    if 0 <= index < len(_BUTTON_KEYS):
+        return _BUTTON_KEYS[index]
+    return f"b{index + 1}"
+
+
+@lru_cache(maxsize=256)
+def _slider_id_to_key(slider_id: str) -> str:
+    """Map a deprecated slider ID (e.g. slider_0) to its config key, default s1."""
+    try:
+        sep = slider_id.rfind('_')
+        if sep < 0:
+            return "s1"
+        return _slider_key(int(slider_id[sep + 1:]))
+    except (ValueError, AttributeError):
+        return "s1"
+
+
+@lru_cache(maxsize=256)
+def _button_id_to_key(button_id: str):
+    """Map a deprecated button ID (e.g. btn_0) to its config key, or None."""
+    try:
+        sep = button_id.rfind('_')
+        if sep < 0:
+            return None
+        return _button_key(int(button_id[sep + 1:]))
+    except (ValueError, AttributeError):
+        return None
+
 class SettingsManager:
     """
     Manages application settings and state using ConfigManager as backend.
-    Singleton pattern to ensure global access to the same state.
+    Use the module-level ``settings_manager`` instance for global access to
+    the same state.
     """
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+
+    __slots__ = (
+        'config_manager',
+        '_cache', '_cache_source',
+        '_batch_depth', '_batch_dirty',
+    )
     
-    def _initialize(self):
+    def __init__(self):
         """Initialize connection to ConfigManager."""
         self.config_manager = ConfigManager()
         
-        # Ensure default values exist in ConfigManager if strictly needed,
-        # but ConfigManager usually handles defaults via getters.
-        pass
+        # Memoised UI setting reads, keyed by config key. Dropped on every
+        # save()/load(), and whenever ConfigManager swaps in a new config
+        # dict (another component called load_config()).
+        self._cache = {}
+        self._cache_source = None
+
+        # Deferred-save state for batch()
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+    def _get_cached(self, key: str, default=None):
+        """Get a config value, memoised until the next write or reload."""
+        config = self.config_manager.config
+        if config is not self._cache_source:
+            self._cache.clear()
+            self._cache_source = config
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self.config_manager.get_config_value(key, default)
+            return value
+
+    def _set_and_save(self, key: str, value):
+        """Write a config value and save, skipping the write if unchanged."""
+        config = self.config_manager.config
+        if key in config and config[key] == value:
+            return
+        config[key] = value
+        self.config_manager.has_changes = True
+        self.save()
 
     def load(self):
         """Reload settings from backend."""
+        self._cache.clear()
         self.config_manager.load_config()
 
     def save(self):
-        """Save settings to backend."""
+        """Save settings to backend (deferred while inside batch())."""
+        self._cache.clear()
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
         self.config_manager.save_config_if_changed()
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer saves until the outermost ``with settings_manager.batch():``
+        block exits, so multi-field updates hit the disk once.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self.config_manager.save_config_if_changed()
         
     def get_start_hidden(self) -> int:
         return 1 if self.config_manager.get_start_in_tray() else 0
     
     def set_start_hidden(self, value: int):
         self.config_manager.set_start_in_tray(bool(value))
-        self.save()
+        # set_start_in_tray already schedules a save if changed
         
     def get_start_on_startup(self) -> int:
         # This might be checked dynamically elsewhere, but if stored in config:
-        return self.config_manager.get_config_value('start_on_startup', 0)
+        return self._get_cached('start_on_startup', 0)
         
     def set_start_on_startup(self, value: int):
         # ConfigManager doesn't seem to have a setter for this exposed easily besides generic
         # but CoreController handles the actual startup registry change.
         # We just store the preference here if needed.
         # Assuming we store it in config for UI state:
-        self.config_manager.config['start_on_startup'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('start_on_startup', value)
         
     def get_button_alignment(self) -> str:
-        return self.config_manager.get_config_value('ui2_button_alignment', 'horizontal')
+        return self._get_cached('ui2_button_alignment', 'horizontal')
         
     def set_button_alignment(self, value: str):
-        if value in ["vertical", "horizontal"]:
-            self.config_manager.config['ui2_button_alignment'] = value
-            self.config_manager.has_changes = True
-            self.save()
+        if value in _VALID_BUTTON_ALIGNMENTS:
+            self._set_and_save('ui2_button_alignment', value)
 
     def get_accent_color(self) -> str:
         """Get the saved accent color (default: teal)."""
-        return self.config_manager.get_config_value('accent_color', 'teal')
+        return self._get_cached('accent_color', 'teal')
 
     def set_accent_color(self, value: str):
         """Set and save the accent color."""
-        self.config_manager.config['accent_color'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('accent_color', value)
 
     def get_slider_sampling(self) -> str:
         return self.config_manager.get_slider_sampling()
@@ -83,134 +170,117 @@ class SettingsManager:
         
     # Grid Layout Methods
     def get_grid_dimensions(self) -> tuple[int, int]:
-        rows = self.config_manager.get_config_value('ui2_grid_rows', 0)
-        cols = self.config_manager.get_config_value('ui2_grid_cols', 0)
+        rows = self._get_cached('ui2_grid_rows', 0)
+        cols = self._get_cached('ui2_grid_cols', 0)
         return rows, cols
         
     def set_grid_dimensions(self, rows: int, cols: int):
-        self.config_manager.config['ui2_grid_rows'] = rows
-        self.config_manager.config['ui2_grid_cols'] = cols
+        config = self.config_manager.config
+        if config.get('ui2_grid_rows') == rows and config.get('ui2_grid_cols') == cols:
+            return
+        config['ui2_grid_rows'] = rows
+        config['ui2_grid_cols'] = cols
         self.config_manager.has_changes = True
         self.save()
         
     def get_button_matrix(self):
-        return self.config_manager.get_config_value('ui2_button_matrix', [])
+        return self._get_cached('ui2_button_matrix', ())
         
     def set_button_matrix(self, matrix):
-        self.config_manager.config['ui2_button_matrix'] = matrix
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('ui2_button_matrix', matrix)
         
     def get_slider_order(self):
-        return self.config_manager.get_config_value('ui2_slider_order', [])
+        return self._get_cached('ui2_slider_order', ())
         
     def set_slider_order(self, order):
-        self.config_manager.config['ui2_slider_order'] = order
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('ui2_slider_order', order)
 
     # --- LED Settings ---
     def get_led_brightness(self) -> int:
-        return self.config_manager.get_config_value('led_brightness', 80)
+        return self._get_cached('led_brightness', 80)
 
     def set_led_brightness(self, value: int):
-        self.config_manager.config['led_brightness'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_brightness', value)
 
     def get_led_anim_speed(self) -> int:
-        return self.config_manager.get_config_value('led_anim_speed', 5)
+        return self._get_cached('led_anim_speed', 5)
 
     def set_led_anim_speed(self, value: int):
-        self.config_manager.config['led_anim_speed'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_anim_speed', value)
 
     def get_slider_led_fill(self) -> int:
-        return self.config_manager.get_config_value('led_slider_fill', 1)
+        return self._get_cached('led_slider_fill', 1)
 
     def set_slider_led_fill(self, value: int):
-        self.config_manager.config['led_slider_fill'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_slider_fill', value)
 
     def get_slider_led_style(self) -> int:
-        return self.config_manager.get_config_value('led_slider_style', 0)
+        return self._get_cached('led_slider_style', 0)
 
     def set_slider_led_style(self, value: int):
-        self.config_manager.config['led_slider_style'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_slider_style', value)
 
     def get_slider_color_mode(self) -> str:
-        return self.config_manager.get_config_value('led_slider_color_mode', "all")
+        return self._get_cached('led_slider_color_mode', "all")
 
     def set_slider_color_mode(self, value: str):
-        self.config_manager.config['led_slider_color_mode'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_slider_color_mode', value)
 
     def get_slider_led_colors(self) -> list:
-        return self.config_manager.get_config_value('led_slider_colors', [])
+        return self._get_cached('led_slider_colors', [])
 
     def set_slider_led_colors(self, value: list):
-        self.config_manager.config['led_slider_colors'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_slider_colors', value)
 
     def get_button_led_fill(self) -> int:
-        return self.config_manager.get_config_value('led_button_fill', 1)
+        return self._get_cached('led_button_fill', 1)
 
     def set_button_led_fill(self, value: int):
-        self.config_manager.config['led_button_fill'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_button_fill', value)
 
     def get_button_led_style(self) -> int:
-        return self.config_manager.get_config_value('led_button_style', 0)
+        return self._get_cached('led_button_style', 0)
 
     def set_button_led_style(self, value: int):
-        self.config_manager.config['led_button_style'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_button_style', value)
 
     def get_button_color_mode(self) -> str:
-        return self.config_manager.get_config_value('led_button_color_mode', "all")
+        return self._get_cached('led_button_color_mode', "all")
 
     def set_button_color_mode(self, value: str):
-        self.config_manager.config['led_button_color_mode'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_button_color_mode', value)
 
     def get_button_led_colors(self) -> list:
-        return self.config_manager.get_config_value('led_button_colors', [])
+        return self._get_cached('led_button_colors', [])
 
     def set_button_led_colors(self, value: list):
-        self.config_manager.config['led_button_colors'] = value
-        self.config_manager.has_changes = True
-        self.save()
+        self._set_and_save('led_button_colors', value)
 
 
     # --- New Methods for Positional Mapping (Index-based) ---
 
     def get_slider_binding_at_index(self, index: int) -> list[str]:
         """Get bindings for a slider at specific physical index (pos 0 = s1)."""
-        key = f"s{index + 1}"
+        key = _slider_key(index)
         return self.config_manager.load_variable_binding(key) or []
         
     def save_slider_binding_at_index(self, index: int, bindings: list[str]):
         """Save bindings for a slider at specific physical index."""
-        key = f"s{index + 1}"
+        key = _slider_key(index)
         self.config_manager.add_binding(key, bindings)
 
+    def _button_bindings_map(self):
+        """Get the 'button_bindings' mapping without allocating a default."""
+        return self.config_manager.config.get('button_bindings') or _NO_BUTTON_BINDINGS
+
     def get_button_binding_at_index(self, index: int):
         """Get bindings for a button at specific physical index (pos 0 = b1)."""
-        key = f"b{index + 1}"
-        return self.config_manager.config.get('button_bindings', {}).get(key)
+        key = _button_key(index)
+        return self._button_bindings_map().get(key)
 
     def save_button_binding_at_index(self, index: int, binding_data: dict):
          """Save binding data for a button at specific physical index."""
-         key = f"b{index + 1}"
+         key = _button_key(index)
          self.config_manager.add_button_binding(key, binding_data)
 
     # --- Deprecated / Helper ID methods (Still used for finding Order) ---
@@ -221,40 +291,31 @@ class SettingsManager:
         
     def get_config_key_from_slider_id(self, slider_id: str) -> str:
         """Deprecated: ID to key mapping is unreliable after reorder."""
-        try:
-            idx = int(slider_id.split('_')[1])
-            return f"s{idx + 1}"
-        except:
-            return "s1"
+        return _slider_id_to_key(slider_id)
             
     def get_slider_bindings(self, slider_id: str) -> list[str]:
         """Deprecated: Use get_slider_binding_at_index."""
         # Fallback to ID-based for backward compat if needed during migration
-        key = self.get_config_key_from_slider_id(slider_id)
+        key = _slider_id_to_key(slider_id)
         return self.config_manager.load_variable_binding(key) or []
         
     def set_slider_bindings(self, slider_id: str, bindings: list[str]):
         """Deprecated."""
-        key = self.get_config_key_from_slider_id(slider_id)
+        key = _slider_id_to_key(slider_id)
         self.config_manager.add_binding(key, bindings) 
 
     def get_button_bindings(self, button_id: str):
         """Deprecated: Use get_button_binding_at_index."""
-        try:
-             idx = int(button_id.split('_')[1])
-             key = f"b{idx + 1}"
-             return self.config_manager.config.get('button_bindings', {}).get(key)
-        except:
+        key = _button_id_to_key(button_id)
+        if key is None:
             return None
+        return self._button_bindings_map().get(key)
 
     def set_button_binding(self, button_id: str, binding_data: dict):
          """Deprecated."""
-         try:
-             idx = int(button_id.split('_')[1])
-             key = f"b{idx + 1}"
+         key = _button_id_to_key(button_id)
+         if key is not None:
              self.config_manager.add_button_binding(key, binding_data)
-         except:
-             pass
 
     def get_app_list(self) -> list[str]:
         """Get the list of custom applications."""
@@ -263,21 +324,27 @@ class SettingsManager:
     def add_app_to_list(self, app_name: str):
         """Add an application to the custom list."""
         current_list = self.get_app_list()
-        # Case-insensitive check
-        if not any(app.lower() == app_name.lower() for app in current_list):
+        # Case-insensitive check. A plain scan: ConfigManager edits this list
+        # in place, so any cached index of it could go stale.
+        lower_name = app_name.lower()
+        if not any(app.lower() == lower_name for app in current_list):
             current_list.append(app_name)
+            # The list is mutated in place, so mark the change explicitly
             self.config_manager.config['app_list'] = current_list
             self.config_manager.has_changes = True
             self.save()
 
     def remove_app_from_list(self, app_name: str):
         """Remove an application from the custom list."""
-        current_list = self.get_app_list()
-        if app_name in current_list:
+        current_list = self.config_manager.config.get('app_list')
+        if not current_list:
+            return
+        try:
             current_list.remove(app_name)
-            self.config_manager.config['app_list'] = current_list
-            self.config_manager.has_changes = True
-            self.save()
+        except ValueError:
+            return
+        self.config_manager.has_changes = True
+        self.save()
 
 # Global instance
 settings_manager = SettingsManager()
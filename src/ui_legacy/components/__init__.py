@@ -1,6 +1,6 @@
 """UI Components - Reusable styled widgets"""
 from .styled_button import StyledButton, IconButton
-from .styled_frame import StyledFrame, StyledLabelFrame, ScrollableFrame
+from .styled_frame import StyledFrame, StyledLabelFrame, ScrollableFrame, bind_canvas_mousewheel
 from .styled_combobox import StyledCombobox
 
 __all__ = [
@@ -9,5 +9,6 @@ __all__ = [
     'StyledFrame',
     'StyledLabelFrame',
     'ScrollableFrame',
+    'bind_canvas_mousewheel',
     'StyledCombobox'
 ]
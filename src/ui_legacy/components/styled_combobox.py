@@ -1,10 +1,20 @@
 """Reusable styled combobox components"""
+import weakref
 from tkinter import ttk
+import tkinter.font as tkfont
 
 
 class StyledCombobox(ttk.Combobox):
     """Custom styled combobox with consistent appearance"""
 
+    FONT_FAMILY = "Arial"
+    FONT_SIZE = 9
+
+    # Named Tk font shared by every instance under the same Tk root, created
+    # on first use. Keyed by root, so a recreated root never gets a font from
+    # a destroyed interpreter; weak keys let dead roots drop out.
+    _shared_fonts = weakref.WeakKeyDictionary()
+
     def __init__(self, parent, values=None, width=20, state="readonly", **kwargs):
         """
         Create a styled combobox
@@ -16,13 +26,7 @@ class StyledCombobox(ttk.Combobox):
             state: Combobox state ("readonly", "normal")
             **kwargs: Additional combobox options
         """
-        default_options = {
-            "font": ("Arial", 9),
-            "width": width,
-            "state": state
-        }
-
-        combobox_options = {**default_options, **kwargs}
+        combobox_options = {"font": self._get_shared_font(parent), "width": width, "state": state, **kwargs}
 
         super().__init__(parent, **combobox_options)
 
@@ -32,3 +36,14 @@ class StyledCombobox(ttk.Combobox):
         # Set default value if values provided
         if values and len(values) > 0:
             self.set(values[0])
+
+    @classmethod
+    def _get_shared_font(cls, parent):
+        """Get the shared named font for parent's Tk root, creating it once per root"""
+        root = parent._root()
+        font = cls._shared_fonts.get(root)
+        if font is None:
+            font = cls._shared_fonts[root] = tkfont.Font(
+                root=root, family=cls.FONT_FAMILY, size=cls.FONT_SIZE
+            )
+        return font
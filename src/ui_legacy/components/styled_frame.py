@@ -3,6 +3,56 @@ import tkinter as tk
 from tkinter import ttk
 
 
+def bind_canvas_mousewheel(canvas):
+    """
+    Scroll a canvas with the mouse wheel while the pointer is over it
+
+    The handler is bound once on the toplevel (so other widgets' unbind_all
+    calls can't remove it) and hit-tests the pointer, which also covers the
+    canvas' embedded windows. It is removed again when the canvas is destroyed.
+
+    Args:
+        canvas: Canvas to scroll
+    """
+    toplevel = canvas.winfo_toplevel()
+    canvas_path = str(canvas)
+
+    def on_mousewheel(event):
+        try:
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, tk.TclError):
+            # Pointer is over a Tk-internal widget (e.g. a combobox popdown)
+            return
+        if widget is None:
+            return
+
+        widget_path = str(widget)
+        if widget_path != canvas_path and not widget_path.startswith(canvas_path + "."):
+            return
+
+        # Whole wheel notches, truncated toward zero so small (touchpad)
+        # deltas don't scroll in one direction only
+        delta = event.delta
+        steps = delta // 120 if delta >= 0 else -(-delta // 120)
+        canvas.yview_scroll(-steps, "units")
+
+    funcid = toplevel.bind("<MouseWheel>", on_mousewheel, add="+")
+
+    def on_destroy(event):
+        # Misc.unbind(sequence, funcid) drops every handler for the sequence
+        # (before Python 3.13), so remove only this one from the script
+        try:
+            script = toplevel.bind("<MouseWheel>")
+            kept = "\n".join(line for line in script.split("\n") if funcid not in line)
+            toplevel.tk.call("bind", str(toplevel), "<MouseWheel>", kept)
+            toplevel.deletecommand(funcid)
+        except tk.TclError:
+            # The toplevel is being destroyed as well
+            pass
+
+    canvas.bind("<Destroy>", on_destroy, add="+")
+
+
 class StyledFrame(tk.Frame):
     """Custom styled frame with consistent appearance"""
 
@@ -21,6 +71,14 @@ class StyledFrame(tk.Frame):
 class StyledLabelFrame(tk.LabelFrame):
     """Custom styled label frame with consistent appearance"""
 
+    DEFAULT_OPTIONS = {
+        "bg": "#2d2d2d",
+        "fg": "white",
+        "font": ("Arial", 10, "bold"),
+        "padx": 8,
+        "pady": 8
+    }
+
     def __init__(self, parent, text="", **kwargs):
         """
         Create a styled label frame
@@ -30,15 +88,7 @@ class StyledLabelFrame(tk.LabelFrame):
             text: Frame label text
             **kwargs: Additional frame options
         """
-        default_options = {
-            "bg": "#2d2d2d",
-            "fg": "white",
-            "font": ("Arial", 10, "bold"),
-            "padx": 8,
-            "pady": 8
-        }
-
-        frame_options = {**default_options, **kwargs}
+        frame_options = {**self.DEFAULT_OPTIONS, **kwargs}
         super().__init__(parent, text=text, **frame_options)
 
 
@@ -49,6 +99,10 @@ class ScrollableFrame(tk.Frame):
         """
         Create a scrollable frame
 
+        The canvas, scrollbar and inner container are built on first use
+        (``container`` access, ``set_height`` or the frame being mapped), so
+        frames on hidden tabs cost a single widget until they are shown.
+
         Args:
             parent: Parent widget
             bg: Background color
@@ -57,21 +111,46 @@ class ScrollableFrame(tk.Frame):
         """
         super().__init__(parent, **kwargs)
 
+        self._bg = bg
+        self._height = height
+
+        self.canvas = None
+        self.scrollbar = None
+        self.canvas_window = None
+        self._container = None
+        self._scrollregion_pending = False
+
+        self.bind("<Map>", self._on_map, add="+")
+
+    @property
+    def container(self):
+        """Inner frame that holds the scrollable content"""
+        self._ensure_built()
+        return self._container
+
+    def _on_map(self, event):
+        """Build child widgets the first time the frame becomes visible"""
+        self._ensure_built()
+
+    def _ensure_built(self):
+        """Create canvas, scrollbar and container if not done yet"""
+        if self.canvas is not None:
+            return
+
+        bg = self._bg
+
         # Create canvas and scrollbar
         self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
 
         # Create container frame inside canvas
-        self.container = tk.Frame(self.canvas, bg=bg)
+        self._container = tk.Frame(self.canvas, bg=bg)
 
         # Configure canvas scrolling
-        self.container.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self._container.bind("<Configure>", self._queue_scrollregion_update)
 
         # Create window in canvas
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.container, anchor="nw")
+        self.canvas_window = self.canvas.create_window((0, 0), window=self._container, anchor="nw")
 
         # Configure canvas scroll command
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -81,26 +160,32 @@ class ScrollableFrame(tk.Frame):
         self.scrollbar.pack(side="right", fill="y")
 
         # Set height if specified
-        if height:
-            self.canvas.configure(height=height)
+        if self._height:
+            self.canvas.configure(height=self._height)
 
-        # Mouse wheel scrolling
-        self._bind_mousewheel()
+        # Mouse wheel scrolling, over the canvas and the container alike
+        bind_canvas_mousewheel(self.canvas)
 
         # Bind canvas width to container width
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
+    def _queue_scrollregion_update(self, event=None):
+        """Coalesce a burst of <Configure> events into one update per idle tick"""
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        """Recompute the canvas scroll region"""
+        self._scrollregion_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def _on_canvas_configure(self, event):
         """Update container width when canvas is resized"""
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
-    def _bind_mousewheel(self):
-        """Bind mouse wheel scrolling"""
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
     def set_height(self, height):
         """Set canvas height"""
+        self._height = height
+        self._ensure_built()
         self.canvas.configure(height=height)
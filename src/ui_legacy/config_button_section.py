@@ -1,13 +1,161 @@
 # ui/config_button_section.py
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import functools
+import logging
 import os
+import queue
+import re
+import time
 from utils.error_handler import log_error
+from ui.components import bind_canvas_mousewheel
+
+# Windows-specific imports for the shortcut-preserving file dialog
+try:
+    import win32gui
+    import win32con
+    HAS_WIN32_DIALOG = True
+except ImportError:
+    HAS_WIN32_DIALOG = False
+
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+
+# Optional: needed only for keybind recording
+try:
+    import keyboard
+except ImportError:
+    keyboard = None
+
+log = logging.getLogger(__name__)
+
+# WScript.Shell COM object, dispatched on first use (see _get_wshell)
+_wshell = None
+
+
+def _get_wshell():
+    """Get the shared WScript.Shell object used to read .lnk shortcuts"""
+    global _wshell
+    if _wshell is None:
+        _wshell = win32com.client.Dispatch("WScript.Shell")
+    return _wshell
+
+# Button binding keys look like "b1", "b2", ...
+_BUTTON_NAME_RE = re.compile(r'^b(\d+)$')
+
+# Shown in a keybind entry while recording; never saved or tested as keys
+_RECORDING_PROMPT = "Recording... (ESC to cancel)"
+
+# Most keys a recorded keybind may hold (modifiers plus a key or two)
+_MAX_CHORD_KEYS = 8
+
+# Keyboard-library key names mapped to the names stored in keybinds
+_KEY_NORMALIZATION_MAP = {
+    'ctrl': 'ctrl',
+    'control': 'ctrl',
+    'shift': 'shift',
+    'alt': 'alt',
+    'win': 'win',
+    'windows': 'win',
+    'cmd': 'cmd',
+    'command': 'cmd',
+    'space': 'space',
+    'enter': 'enter',
+    'return': 'enter',
+    'tab': 'tab',
+    'backspace': 'backspace',
+    'delete': 'delete',
+    'del': 'delete',
+    'up': 'up',
+    'down': 'down',
+    'left': 'left',
+    'right': 'right',
+    'page up': 'page up',
+    'page down': 'page down',
+    'home': 'home',
+    'end': 'end',
+    'insert': 'insert'
+}
+
+# Field defaults for a stored button binding, in _unpack_binding() order
+_DEFAULT_BINDING = {
+    'action': '',
+    'target': '',
+    'keybind': '',
+    'app_path': '',
+    'app_display_name': '',
+    'output_mode': 'cycle',
+    'output_device': ''
+}
+
+
+def _unpack_binding(binding):
+    """
+    Normalize a stored button binding into its fields
+
+    Bindings are either a dict or, in older configs, just the action name.
+
+    Returns:
+        (action, target, keybind, app_path, app_display_name, output_mode, output_device)
+    """
+    if isinstance(binding, dict):
+        return tuple(binding.get(key, default) for key, default in _DEFAULT_BINDING.items())
+    return (binding, '', '', '', '', 'cycle', '')
+
+
+def _mute_test_kwargs(target, keybind, app_path, output_selection):
+    return {'target': target} if target else {}
+
+
+def _keybind_test_kwargs(target, keybind, app_path, output_selection):
+    """Keys to test, or None while the entry still shows the recording prompt"""
+    if not keybind:
+        return {}
+
+    clean_keybind = keybind.strip()
+
+    # Don't test if it's still a recording message
+    if not clean_keybind or clean_keybind == _RECORDING_PROMPT:
+        return None
+
+    return {'keys': clean_keybind}
+
+
+def _launch_app_test_kwargs(target, keybind, app_path, output_selection):
+    return {'app_path': app_path} if app_path else {}
+
+
+def _switch_audio_output_test_kwargs(target, keybind, app_path, output_selection):
+    if output_selection == "Cycle Through":
+        return {'output_mode': 'cycle'}
+    return {'output_mode': 'select', 'device_name': output_selection}
+
+
+# Action name -> builder of execute_action() kwargs for the Test button.
+# Builders take (target, keybind, app_path, output_selection).
+_TEST_KWARG_BUILDERS = {
+    "mute": _mute_test_kwargs,
+    "keybind": _keybind_test_kwargs,
+    "launch_app": _launch_app_test_kwargs,
+    "switch_audio_output": _switch_audio_output_test_kwargs,
+}
 
 
 class ConfigButtonSection:
     """Handles the Button Bindings UI and logic."""
 
+    # Fixed height of one binding row slot on the canvas at 100% scaling
+    # (pixels); the slot actually used is scaled with Tk (see _row_height)
+    ROW_HEIGHT = 36
+
+    # How long an audio output device enumeration is reused (seconds)
+    AUDIO_DEVICES_TTL_S = 2.0
+
+    # Quiet period before a row edit is saved; rapid edits share one save (ms)
+    AUTO_SAVE_DELAY_MS = 250
+
     def __init__(self, parent_frame, audio_manager, config_manager, common_helpers, serial_handler=None):
         self.audio_manager = audio_manager
         self.config_manager = config_manager
@@ -15,9 +163,24 @@ class ConfigButtonSection:
         self.serial_handler = serial_handler
         self.button_binding_rows = {}  # Store rows by button name
         self.device_button_count = 0  # Track device configuration
+        self._audio_devices_cache = None  # (timestamp, device names)
+        self._layout_suspended = 0  # >0 while rows are added/removed in bulk
+        self._button_num_index = {}  # row name -> button number, for "bN" rows
+        self._pending_saves = {}  # row name -> (Tk after() id, auto-save args) of a queued save
+        self._button_row_count = 0  # rows whose name starts with 'b' (status label)
+        self._row_height = self.ROW_HEIGHT  # row slot height at the current scaling
+
+        # Bind tag carrying the shared auto-save handler for every row's inputs
+        self._row_edit_tag = f"ButtonRowEdit{id(self)}"
+
+        # ActionHandler used by the Test buttons, built on first use
+        self._action_handler = None
+
+        # Dropdown values shared by every row; see invalidate_action_caches()
+        self._actions_cache = None
+        self._targets_cache = None
 
         self.button_canvas = None
-        self.button_container = None
         self._create_ui(parent_frame)
 
         # Register for configuration updates if serial_handler is provided
@@ -28,75 +191,60 @@ class ConfigButtonSection:
         """Handle device configuration updates - automatically create/remove button binding rows"""
         try:
             self.device_button_count = button_count
-            print(f"Device config: {button_count} buttons, creating/updating binding rows")
+            self.invalidate_action_caches()
+            log.debug("Device config: %d buttons, creating/updating binding rows", button_count)
             self._synchronize_button_bindings(button_count)
         except Exception as e:
             log_error(e, "Error creating button bindings from device config")
 
     def _synchronize_button_bindings(self, device_button_count):
         """Synchronize UI with device configuration - create missing or remove extra rows"""
+        self._suspend_layout()
         try:
             # Get current config bindings
             config = self.config_manager.load_config()
             config_bindings = config.get('button_bindings', {})
 
             # Find which buttons exist in config
-            config_buttons = set()
-            for button_name in config_bindings.keys():
-                if button_name.startswith('b') and button_name[1:].isdigit():
-                    config_buttons.add(int(button_name[1:]))
+            config_buttons = {
+                int(match.group(1))
+                for match in map(_BUTTON_NAME_RE.match, config_bindings)
+                if match
+            }
 
-            print(f"Config has buttons: {sorted(config_buttons)}")
-            print(f"Device has buttons: {list(range(1, device_button_count + 1))}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Config has buttons: %s", sorted(config_buttons))
+                log.debug("Device has buttons: %s", list(range(1, device_button_count + 1)))
 
             # Create set of required buttons (union of config and device)
             required_buttons = set(range(1, device_button_count + 1)).union(config_buttons)
-            print(f"Required buttons: {sorted(required_buttons)}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Required buttons: %s", sorted(required_buttons))
 
             # Remove UI rows for buttons that are not in required_buttons
-            rows_to_remove = []
-            for button_name, row_data in self.button_binding_rows.items():
-                if button_name.startswith('b'):
-                    button_num = int(button_name[1:])
-                    if button_num not in required_buttons:
-                        rows_to_remove.append(button_name)
+            rows_to_remove = [
+                button_name for button_name, button_num in self._button_num_index.items()
+                if button_num not in required_buttons
+            ]
 
             for button_name in rows_to_remove:
-                row_data = self.button_binding_rows[button_name]
-                row_data['frame'].destroy()
-                del self.button_binding_rows[button_name]
-                print(f"Removed UI row for {button_name} (not in device or config)")
+                self._remove_button_binding_row(button_name)
+                log.debug("Removed UI row for %s (not in device or config)", button_name)
+
+            if rows_to_remove:
+                self._relayout_rows()
 
             # Create UI rows for missing buttons
-            for button_num in sorted(required_buttons):
+            missing_buttons = required_buttons.difference(self._button_num_index.values())
+            for button_num in sorted(missing_buttons):
                 button_name = f"b{button_num}"
                 display_name = f"Button {button_num}"
 
-                # Skip if row already exists
-                if button_name in self.button_binding_rows:
-                    continue
-
-                # Check if binding exists in config
-                config = self.config_manager.load_config()
-                button_bindings = config.get('button_bindings', {})
-                binding_data = button_bindings.get(button_name, {})
-
-                if isinstance(binding_data, dict):
-                    action = binding_data.get('action', '')
-                    target = binding_data.get('target', '')
-                    keybind = binding_data.get('keybind', '')
-                    app_path = binding_data.get('app_path', '')
-                    app_display_name = binding_data.get('app_display_name', '')  # New field
-                    output_mode = binding_data.get('output_mode', 'cycle')
-                    output_device = binding_data.get('output_device', '')
-                else:
-                    action = binding_data
-                    target = ''
-                    keybind = ''
-                    app_path = ''
-                    app_display_name = ''
-                    output_mode = 'cycle'
-                    output_device = ''
+                # Check if binding exists in config (loaded once above)
+                binding_data = config_bindings.get(button_name, {})
+
+                (action, target, keybind, app_path, app_display_name,
+                 output_mode, output_device) = _unpack_binding(binding_data)
 
                 # Determine if this is auto-created (not in config but in device)
                 is_auto = (button_num <= device_button_count and button_num not in config_buttons)
@@ -116,18 +264,19 @@ class ConfigButtonSection:
                 )
 
                 if is_auto:
-                    print(f"Auto-created UI row for {button_name}")
+                    log.debug("Auto-created UI row for %s", button_name)
                 else:
-                    print(f"Created UI row for {button_name} from config")
+                    log.debug("Created UI row for %s from config", button_name)
 
             # Update status label
             if self.status_label:
-                visible_count = len([name for name in self.button_binding_rows.keys() if name.startswith('b')])
                 self.status_label.config(
-                    text=f"Showing {visible_count} button bindings ({device_button_count} from device)")
+                    text=f"Showing {self._button_row_count} button bindings ({device_button_count} from device)")
 
         except Exception as e:
             log_error(e, "Error synchronizing button bindings")
+        finally:
+            self._resume_layout()
 
 
     def _create_ui(self, parent):
@@ -173,25 +322,32 @@ class ConfigButtonSection:
                 command=self.button_canvas.yview
             )
 
-            self.button_container = tk.Frame(self.button_canvas, bg="#2d2d2d")
-            self.button_container.bind(
-                "<Configure>",
-                lambda e: self.button_canvas.configure(scrollregion=self.button_canvas.bbox("all"))
-            )
+            # Rows are placed straight onto the canvas in fixed-height slots and
+            # only built once their slot scrolls into view (see _refresh_visible)
+            def _on_yscroll(first, last):
+                scrollbar.set(first, last)
+                self._refresh_visible()
+
+            # Row widgets grow with DPI scaling, so the fixed slots must too.
+            # Tk's scaling is 96/72 pixels per point at 100%.
+            scaling = float(self.button_canvas.tk.call('tk', 'scaling'))
+            self._row_height = max(self.ROW_HEIGHT, round(self.ROW_HEIGHT * scaling * 72 / 96))
 
-            self.button_canvas.create_window((0, 0), window=self.button_container, anchor="nw")
-            self.button_canvas.configure(yscrollcommand=scrollbar.set)
+            self.button_canvas.configure(yscrollcommand=_on_yscroll)
+            self.button_canvas.bind("<Configure>", self._on_canvas_configure)
 
             self.button_canvas.grid(row=0, column=0, sticky="nsew")
             scrollbar.grid(row=0, column=1, sticky="ns")
 
-            def _on_mousewheel(event):
-                self.button_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            # One wheel binding for the whole window; the handler checks the pointer
+            bind_canvas_mousewheel(self.button_canvas)
 
-            self.button_canvas.bind("<Enter>", lambda e: self.button_canvas.bind_all("<MouseWheel>", _on_mousewheel))
-            self.button_canvas.bind("<Leave>", lambda e: self.button_canvas.unbind_all("<MouseWheel>"))
-            self.button_container.bind("<Enter>", lambda e: self.button_canvas.bind_all("<MouseWheel>", _on_mousewheel))
-            self.button_container.bind("<Leave>", lambda e: self.button_canvas.unbind_all("<MouseWheel>"))
+            # Debounced edits would be lost with the canvas; save them first
+            self.button_canvas.bind("<Destroy>", self._flush_pending_saves, add="+")
+
+            # Row edits: registered once here, attached to inputs via _tag_row_edit()
+            for sequence in ('<<ComboboxSelected>>', '<FocusOut>', '<Return>'):
+                self.button_canvas.bind_class(self._row_edit_tag, sequence, self._on_row_edit)
 
             # Status label for auto-creation
             self.status_label = tk.Label(
@@ -211,37 +367,30 @@ class ConfigButtonSection:
 
     def load_bindings(self, config):
         """Load bindings from config and create UI rows."""
+        self._suspend_layout()
         try:
-            # Clear existing rows first
-            for widget in self.button_container.winfo_children():
-                widget.destroy()
-
-            self.button_binding_rows = {}
+            button_bindings = config.get('button_bindings', {})
 
             # If device is connected, use device-based synchronization
             if self.device_button_count > 0:
+                # Refresh rows in place; synchronization adds/removes the rest
+                for button_name in self.button_binding_rows:
+                    self._update_button_binding_row(button_name, button_bindings.get(button_name, {}))
                 self._synchronize_button_bindings(self.device_button_count)
             else:
                 # Load bindings from config (no device connected)
-                button_bindings = config.get('button_bindings', {})
+                # Only rows whose binding disappeared are destroyed
+                stale_rows = [name for name in self.button_binding_rows if name not in button_bindings]
+                for button_name in stale_rows:
+                    self._remove_button_binding_row(button_name)
 
                 for button_name, binding in button_bindings.items():
-                    if isinstance(binding, dict):
-                        action = binding.get('action', '')
-                        target = binding.get('target', '')
-                        keybind = binding.get('keybind', '')
-                        app_path = binding.get('app_path', '')
-                        app_display_name = binding.get('app_display_name', '')  # New field
-                        output_mode = binding.get('output_mode', 'cycle')
-                        output_device = binding.get('output_device', '')
-                    else:
-                        action = binding
-                        target = ''
-                        keybind = ''
-                        app_path = ''
-                        app_display_name = ''
-                        output_mode = 'cycle'
-                        output_device = ''
+                    if button_name in self.button_binding_rows:
+                        self._update_button_binding_row(button_name, binding)
+                        continue
+
+                    (action, target, keybind, app_path, app_display_name,
+                     output_mode, output_device) = _unpack_binding(binding)
 
                     if button_name:
                         # Create display name
@@ -264,20 +413,49 @@ class ConfigButtonSection:
                             is_auto=False
                         )
 
+                if stale_rows:
+                    self._relayout_rows()
+
                 # Update status label
                 if self.status_label:
-                    button_count = len([name for name in button_bindings.keys() if name.startswith('b')])
                     self.status_label.config(
-                        text=f"Showing {button_count} button bindings from config (no device connected)")
+                        text=f"Showing {self._button_row_count} button bindings from config (no device connected)")
 
         except Exception as e:
             log_error(e, "Error loading button bindings")
+        finally:
+            self._resume_layout()
+
+    def _get_available_actions(self):
+        """Action dropdown values, fetched once per section"""
+        if self._actions_cache is None:
+            self._actions_cache = self.helpers.get_available_actions()
+        return self._actions_cache
+
+    def _get_available_targets(self):
+        """Mute target dropdown values, fetched once until invalidated"""
+        if self._targets_cache is None:
+            self._targets_cache = self.helpers.get_available_targets()
+        return self._targets_cache
+
+    def invalidate_action_caches(self):
+        """Forget cached dropdown values (call when devices or apps change)"""
+        self._actions_cache = None
+        self._targets_cache = None
 
     def _get_audio_output_devices(self):
-        """Get available audio output device names"""
+        """Get available audio output device names (reused for a short TTL)"""
+        now = time.monotonic()
+        if self._audio_devices_cache is not None:
+            stamp, devices = self._audio_devices_cache
+            if now - stamp < self.AUDIO_DEVICES_TTL_S:
+                return devices
+
         try:
             from audio.output_switch import get_device_names
-            return get_device_names()
+            devices = get_device_names()
+            self._audio_devices_cache = (now, devices)
+            return devices
         except Exception as e:
             log_error(e, "Error getting audio devices")
             return []
@@ -298,19 +476,60 @@ class ConfigButtonSection:
         except Exception as e:
             log_error(e, "Error refreshing audio devices")
 
-    def _auto_save_button_binding(self, button_name, action_combo, target_combo,
-                                  keybind_var, app_path_var, app_display_name_var, output_mode_combo,
-                                  output_device_combo):
+    def _cancel_pending_save(self, button_name):
+        """Cancel a row's queued auto-save, if any"""
+        pending = self._pending_saves.pop(button_name, None)
+        if pending is not None:
+            self.button_canvas.after_cancel(pending[0])
+
+    def _flush_pending_saves(self, event=None):
+        """Run every queued auto-save now, before the canvas goes away"""
+        pending_saves, self._pending_saves = self._pending_saves, {}
+        for button_name, (after_id, args) in pending_saves.items():
+            self.button_canvas.after_cancel(after_id)
+            self._auto_save_button_binding(button_name, *args)
+
+    def _tag_row_edit(self, widget, button_name):
+        """Make a row input auto-save its row through the shared edit handler"""
+        widget.row_button_name = button_name
+        tags = widget.bindtags()
+        # After the widget's own tag, so per-widget handlers run first
+        widget.bindtags(tags[:1] + (self._row_edit_tag,) + tags[1:])
+
+    def _on_row_edit(self, event):
+        """Shared edit handler for all rows; the row comes from the widget"""
+        self._queue_row_save(event.widget.row_button_name)
+
+    def _queue_row_save(self, button_name):
+        """Schedule an auto-save of a built row's current values"""
+        row_data = self.button_binding_rows.get(button_name)
+        if row_data is None or 'edit_vars' not in row_data:
+            return
+        self._schedule_auto_save(button_name, *row_data['edit_vars'])
+
+    def _schedule_auto_save(self, button_name, *args):
+        """Queue an auto-save for a row, replacing any save still pending for it"""
+        self._cancel_pending_save(button_name)
+
+        def flush():
+            self._pending_saves.pop(button_name, None)
+            self._auto_save_button_binding(button_name, *args)
+
+        after_id = self.button_canvas.after(self.AUTO_SAVE_DELAY_MS, flush)
+        self._pending_saves[button_name] = (after_id, args)
+
+    def _auto_save_button_binding(self, button_name, action_var, target_var,
+                                  keybind_var, app_path_var, app_display_name_var, output_var):
         """Automatically save button binding when changes occur."""
         try:
-            action = self.helpers.normalize_action_name(action_combo.get().strip())
+            action = self.helpers.normalize_action_name(action_var.get().strip())
 
             if not button_name or not button_name.startswith('b'):
                 return False
 
             target = None
-            if action == "mute" and target_combo.winfo_ismapped():
-                target = self.helpers.normalize_target_name(target_combo.get().strip())
+            if action == "mute":
+                target = self.helpers.normalize_target_name(target_var.get().strip())
 
             keybind = None
             if action == "keybind":
@@ -322,9 +541,7 @@ class ConfigButtonSection:
                     # keybind_value = keybind_value.replace("🎙️", "").strip()
 
                     # Filter out recording messages and empty values
-                    if keybind_value and \
-                            "Recording" not in keybind_value and \
-                            "ESC to cancel" not in keybind_value:
+                    if keybind_value and keybind_value != _RECORDING_PROMPT:
                         keybind = keybind_value
 
             app_path = None
@@ -336,14 +553,13 @@ class ConfigButtonSection:
             output_mode = None
             output_device = None
             if action == "switch_audio_output":
-                if output_mode_combo.winfo_ismapped():
-                    output_selection = output_mode_combo.get().strip()
-                    if output_selection and output_selection != "Cycle Through":
-                        output_mode = "select"
-                        output_device = output_selection
-                    else:
-                        output_mode = "cycle"
-                        output_device = None
+                output_selection = output_var.get().strip()
+                if output_selection and output_selection != "Cycle Through":
+                    output_mode = "select"
+                    output_device = output_selection
+                else:
+                    output_mode = "cycle"
+                    output_device = None
 
             binding_data = {
                 'action': action,
@@ -356,6 +572,7 @@ class ConfigButtonSection:
             }
 
             if self.config_manager.add_button_binding(button_name, binding_data):
+                self._record_saved_binding(button_name, binding_data)
                 return True
 
             return False
@@ -369,10 +586,10 @@ class ConfigButtonSection:
         try:
             # Try using Windows shell dialog that preserves .lnk files
             try:
-                import win32gui
-                import win32con
+                if not HAS_WIN32_DIALOG:
+                    raise ImportError("pywin32 is not available")
 
-                print(f"[DEBUG] Using Windows shell dialog")
+                log.debug("Using Windows shell dialog")
 
                 # Use Windows file dialog with flag to not dereference links
                 result = win32gui.GetOpenFileNameW(
@@ -382,7 +599,7 @@ class ConfigButtonSection:
                     Flags=win32con.OFN_FILEMUSTEXIST | win32con.OFN_PATHMUSTEXIST | 0x00100000  # OFN_NODEREFERENCELINKS
                 )
 
-                print(f"[DEBUG] Windows dialog result: {result}")
+                log.debug("Windows dialog result: %r", result)
 
                 # Extract file path
                 if isinstance(result, (tuple, list)):
@@ -390,10 +607,10 @@ class ConfigButtonSection:
                 else:
                     file_path = result
 
-                print(f"[DEBUG] Extracted file path: {file_path}")
+                log.debug("Extracted file path: %s", file_path)
 
             except (ImportError, Exception) as e:
-                print(f"[DEBUG] Windows shell dialog failed: {e}, falling back to tkinter")
+                log.debug("Windows shell dialog failed: %s, falling back to tkinter", e)
                 # Fallback to tkinter dialog
                 file_path = filedialog.askopenfilename(
                     title="Select Application or Shortcut",
@@ -405,29 +622,30 @@ class ConfigButtonSection:
                     ]
                 )
 
-            print(f"[DEBUG] Selected file: {file_path}")
+            log.debug("Selected file: %s", file_path)
 
             if not file_path:
-                print(f"[DEBUG] No file selected, returning False")
+                log.debug("No file selected, returning False")
                 return False
 
-            print(f"[DEBUG] File extension: {os.path.splitext(file_path)[1]}")
-            print(f"[DEBUG] File exists: {os.path.exists(file_path)}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("File extension: %s", os.path.splitext(file_path)[1])
+                log.debug("File exists: %s", os.path.exists(file_path))
 
             # Check if it's a shortcut and extract target + arguments
             if file_path.lower().endswith('.lnk'):
-                print(f"[DEBUG] Processing .lnk shortcut")
+                log.debug("Processing .lnk shortcut")
                 try:
-                    import win32com.client
+                    if win32com is None:
+                        raise ImportError("win32com is not available")
 
-                    shell = win32com.client.Dispatch("WScript.Shell")
-                    shortcut = shell.CreateShortCut(file_path)
+                    shortcut = _get_wshell().CreateShortCut(file_path)
 
                     target_path = shortcut.Targetpath
                     arguments = shortcut.Arguments
 
-                    print(f"[DEBUG] Shortcut target: {target_path}")
-                    print(f"[DEBUG] Shortcut arguments: '{arguments}'")
+                    log.debug("Shortcut target: %s", target_path)
+                    log.debug("Shortcut arguments: '%s'", arguments)
 
                     if target_path:
                         # Combine target + arguments
@@ -436,62 +654,192 @@ class ConfigButtonSection:
                         else:
                             full_command = target_path
 
-                        print(f"[DEBUG] Full command: {full_command}")
+                        log.debug("Full command: %s", full_command)
                         app_path_var.set(full_command)
                     else:
-                        print(f"[DEBUG] No target found, using shortcut path")
+                        log.debug("No target found, using shortcut path")
                         app_path_var.set(file_path)
 
                     # Get shortcut name (without .lnk)
                     app_name = os.path.basename(file_path)[:-4]
 
                 except Exception as e:
-                    print(f"[DEBUG] Error extracting shortcut info: {e}")
+                    log.debug("Error extracting shortcut info: %s", e)
                     # Fallback to using the shortcut path as-is
                     app_path_var.set(file_path)
                     app_name = os.path.basename(file_path)[:-4]
             else:
-                print(f"[DEBUG] Regular file")
+                log.debug("Regular file")
                 # Regular file - store the path
                 app_path_var.set(file_path)
                 app_name = os.path.basename(file_path)
 
-            print(f"[DEBUG] app_path_var set to: {app_path_var.get()}")
-            print(f"[DEBUG] Display name: {app_name}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("app_path_var set to: %s", app_path_var.get())
+                log.debug("Display name: %s", app_name)
 
             # Store the display name
             app_display_name_var.set(app_name)
-            print(f"[DEBUG] app_display_name_var set to: {app_display_name_var.get()}")
 
             # Update the label
             app_name_label.config(text=app_name)
-            print(f"[DEBUG] Label updated to: {app_name}")
-            print(f"[DEBUG] File processing SUCCESS")
+            log.debug("Label updated to: %s", app_name)
 
             return True
 
         except Exception as e:
-            print(f"[DEBUG] Top-level exception: {type(e).__name__}: {str(e)}")
-            import traceback
-            print(f"[DEBUG] Traceback:\n{traceback.format_exc()}")
             log_error(e, "Error browsing for app file")
             messagebox.showerror("Error", f"Could not select application: {str(e)}")
             return False
 
+    # ------------------------------------------------------------------
+    # Row slots / viewport culling
+    # ------------------------------------------------------------------
+
     def _add_button_binding_row(self, button_name="", display_name="", action="", target="",
                                 keybind="", app_path="", app_display_name="", output_mode="cycle", output_device="",
                                 is_auto=False):
-        """Add a button binding row with responsive layout"""
-        try:
-            row_frame = tk.Frame(self.button_container, bg="#353535", padx=6, pady=4)
-            row_frame.pack(fill="x", padx=3, pady=2)
-
-            # Store row data
-            self.button_binding_rows[button_name] = {
-                'frame': row_frame,
-                'is_auto': is_auto,
-                'button_name': button_name
+        """Reserve a row slot; its widgets are built when it becomes visible"""
+        replaced = button_name in self.button_binding_rows
+        if replaced:
+            self._remove_button_binding_row(button_name)
+
+        match = _BUTTON_NAME_RE.match(button_name)
+        if match:
+            self._button_num_index[button_name] = int(match.group(1))
+
+        if button_name.startswith('b'):
+            self._button_row_count += 1
+
+        self.button_binding_rows[button_name] = {
+            'frame': None,
+            'window': None,
+            'y': len(self.button_binding_rows) * self._row_height,
+            'is_auto': is_auto,
+            'button_name': button_name,
+            'spec': {
+                'button_name': button_name,
+                'display_name': display_name,
+                'action': action,
+                'target': target,
+                'keybind': keybind,
+                'app_path': app_path,
+                'app_display_name': app_display_name,
+                'output_mode': output_mode,
+                'output_device': output_device,
+                'is_auto': is_auto
             }
+        }
+
+        if replaced:
+            self._relayout_rows()
+        elif not self._layout_suspended:
+            self._update_scrollregion()
+            self._refresh_visible()
+
+    def _update_button_binding_row(self, button_name, binding):
+        """Apply a binding from config to an existing row, in place"""
+        row_data = self.button_binding_rows[button_name]
+        changes = dict(zip(_DEFAULT_BINDING, _unpack_binding(binding)))
+        spec = row_data['spec']
+        if all(spec[key] == value for key, value in changes.items()):
+            return
+
+        spec.update(changes)
+        # Unbuilt rows pick the new values up from their spec when built
+        if row_data['frame'] is not None:
+            row_data['apply_spec']()
+
+    def _record_saved_binding(self, button_name, binding):
+        """
+        Keep a row's spec in step with what was saved from it
+
+        _update_button_binding_row compares incoming config against the spec,
+        so a spec left at the first-loaded values would hide a reload that
+        restores them over the user's edits.
+        """
+        row_data = self.button_binding_rows.get(button_name)
+        if row_data is not None:
+            row_data['spec'].update(zip(_DEFAULT_BINDING, _unpack_binding(binding)))
+
+    def _remove_button_binding_row(self, button_name):
+        """Destroy a row's widgets (if built) and free its slot"""
+        self._button_num_index.pop(button_name, None)
+        self._cancel_pending_save(button_name)
+        row_data = self.button_binding_rows.pop(button_name, None)
+        if not row_data:
+            return
+        if button_name.startswith('b'):
+            self._button_row_count -= 1
+        if row_data['window'] is not None:
+            self.button_canvas.delete(row_data['window'])
+        if row_data['frame'] is not None:
+            row_data['frame'].destroy()
+
+    def _relayout_rows(self):
+        """Re-pack row slots top to bottom after rows were removed"""
+        for index, row_data in enumerate(self.button_binding_rows.values()):
+            row_data['y'] = index * self._row_height
+            if row_data['window'] is not None:
+                self.button_canvas.coords(row_data['window'], 0, row_data['y'])
+        if not self._layout_suspended:
+            self._update_scrollregion()
+            self._refresh_visible()
+
+    def _suspend_layout(self):
+        """Defer scroll region / visible-row updates during bulk row changes"""
+        self._layout_suspended += 1
+
+    def _resume_layout(self):
+        """End a bulk update; the outermost call updates the layout once"""
+        self._layout_suspended -= 1
+        if self._layout_suspended == 0:
+            self._update_scrollregion()
+            self._refresh_visible()
+
+    def _update_scrollregion(self):
+        """Set the scroll region from the known row count (no bbox walk)"""
+        width = self.button_canvas.winfo_width()
+        height = len(self.button_binding_rows) * self._row_height
+        self.button_canvas.configure(scrollregion=(0, 0, width, height))
+
+    def _on_canvas_configure(self, event):
+        """Stretch built rows to the canvas width and build newly visible ones"""
+        for row_data in self.button_binding_rows.values():
+            if row_data['window'] is not None:
+                self.button_canvas.itemconfigure(row_data['window'], width=event.width)
+        self._update_scrollregion()
+        self._refresh_visible()
+
+    def _refresh_visible(self):
+        """Build the widgets of every row whose slot intersects the viewport"""
+        if not self.button_binding_rows:
+            return
+
+        top = self.button_canvas.canvasy(0)
+        bottom = self.button_canvas.canvasy(max(self.button_canvas.winfo_height(), 1))
+        first = int(top // self._row_height)
+        last = int(bottom // self._row_height) + 1
+
+        for row_data in list(self.button_binding_rows.values())[first:last]:
+            if row_data['frame'] is None:
+                self._build_button_binding_row(row_data, **row_data['spec'])
+
+    def _build_button_binding_row(self, row_data, button_name="", display_name="", action="", target="",
+                                  keybind="", app_path="", app_display_name="", output_mode="cycle",
+                                  output_device="", is_auto=False):
+        """Build a button binding row's widgets into its canvas slot"""
+        try:
+            row_frame = tk.Frame(self.button_canvas, bg="#353535", padx=6, pady=4)
+
+            row_data['frame'] = row_frame
+            row_data['window'] = self.button_canvas.create_window(
+                (0, row_data['y']),
+                window=row_frame,
+                anchor="nw",
+                width=self.button_canvas.winfo_width(),
+                height=self._row_height - 4
+            )
 
             row_frame.grid_columnconfigure(1, weight=0)
             row_frame.grid_columnconfigure(3, weight=0)
@@ -523,7 +871,7 @@ class ConfigButtonSection:
                 font=("Arial", 9)
             ).grid(row=0, column=2, padx=2, sticky="w")
 
-            actions = self.helpers.get_available_actions()
+            actions = self._get_available_actions()
 
             action_var = tk.StringVar()
             action_combo = ttk.Combobox(
@@ -545,159 +893,163 @@ class ConfigButtonSection:
             dynamic_frame = tk.Frame(row_frame, bg="#353535")
             dynamic_frame.grid(row=0, column=4, padx=2, sticky="ew")
 
-            # Target (for mute action)
-            target_label = tk.Label(
-                dynamic_frame,
-                text="Target:",
-                bg="#353535",
-                fg="white",
-                font=("Arial", 9)
-            )
-
+            # Per-action values live in Tk variables so they exist before (and
+            # independently of) the widgets that edit them
             target_var = tk.StringVar()
-            target_combo = ttk.Combobox(
-                dynamic_frame,
-                textvariable=target_var,
-                values=self.helpers.get_available_targets(),
-                width=15,
-                font=("Arial", 9)
-            )
-
             if target:
-                display_target = self.helpers.get_display_name(target)
-                target_combo.set(display_target)
-
-            # Keybind entry (shown when action is keybind)
-            keybind_label = tk.Label(
-                dynamic_frame,
-                text="Keys:",
-                bg="#353535",
-                fg="white",
-                font=("Arial", 9)
-            )
+                target_var.set(self.helpers.get_display_name(target))
 
             keybind_var = tk.StringVar()
-            keybind_entry = tk.Entry(
-                dynamic_frame,
-                textvariable=keybind_var,
-                width=15,
-                font=("Arial", 9)
-            )
             if keybind and isinstance(keybind, str):
                 keybind_var.set(keybind)
 
-            # Record button for keybind
-            keybind_record_btn = tk.Button(
-                dynamic_frame,
-                text="Record",
-                command=lambda: self._record_keybind(keybind_entry, keybind_var, auto_save_wrapper),
-                bg="#404040",
-                fg="white",
-                font=("Arial", 8),
-                relief="flat",
-                padx=5,
-                pady=2,
-                cursor="hand2"
-            )
-
-            # App path selection (shown when action is launch_app)
-            app_path_label = tk.Label(
-                dynamic_frame,
-                text="App:",
-                bg="#353535",
-                fg="white",
-                font=("Arial", 9)
-            )
-
-            # Variables for app selection
             app_path_var = tk.StringVar()
             app_display_name_var = tk.StringVar()
-
             if app_path and isinstance(app_path, str):
                 app_path_var.set(app_path)
-                if app_display_name:
-                    display_text = app_display_name
-                else:
-                    display_text = os.path.basename(app_path)
-                app_display_name_var.set(display_text)
-            else:
-                display_text = "Click to select app"
-                app_display_name_var.set("")
+                app_display_name_var.set(app_display_name or os.path.basename(app_path))
 
-            # Clickable label that opens file dialog
-            app_name_label = tk.Label(
-                dynamic_frame,
-                text=display_text,
-                bg="#404040",
-                fg="white",
-                font=("Arial", 9),
-                relief="sunken",
-                padx=5,
-                pady=2,
-                width=25,
-                cursor="hand2"
-            )
+            output_var = tk.StringVar()
+            if output_mode == "select" and output_device:
+                output_var.set(output_device)
+            else:
+                output_var.set("Cycle Through")
 
-            # Audio output selector (shown when action is switch_audio_output)
-            output_label = tk.Label(
-                dynamic_frame,
-                text="Device:",
-                bg="#353535",
-                fg="white",
-                font=("Arial", 9)
+            # Values read by the shared auto-save (see _on_row_edit). Only Tk
+            # variables, so a save flushed while the row is destroyed still works
+            row_data['edit_vars'] = (
+                action_var, target_var, keybind_var,
+                app_path_var, app_display_name_var, output_var
             )
 
-            output_var = tk.StringVar()
-
-            # Get available audio devices
-            audio_devices = self._get_audio_output_devices()
-            output_options = ["Cycle Through"] + audio_devices
+            # Widgets for each action are only built the first time that
+            # action is selected, then kept for reuse: action -> [widgets]
+            built_widgets = {}
+            row_data['built_widgets'] = built_widgets
+
+            def build_mute_widgets():
+                target_label = tk.Label(
+                    dynamic_frame,
+                    text="Target:",
+                    bg="#353535",
+                    fg="white",
+                    font=("Arial", 9)
+                )
+                target_combo = ttk.Combobox(
+                    dynamic_frame,
+                    textvariable=target_var,
+                    values=self._get_available_targets(),
+                    width=15,
+                    font=("Arial", 9)
+                )
+                self._tag_row_edit(target_combo, button_name)
+                return [target_label, target_combo]
+
+            def build_keybind_widgets():
+                keybind_label = tk.Label(
+                    dynamic_frame,
+                    text="Keys:",
+                    bg="#353535",
+                    fg="white",
+                    font=("Arial", 9)
+                )
+                keybind_entry = tk.Entry(
+                    dynamic_frame,
+                    textvariable=keybind_var,
+                    width=15,
+                    font=("Arial", 9)
+                )
+                # Auto-saves on FocusOut / Return when the user types manually
+                self._tag_row_edit(keybind_entry, button_name)
+
+                # Record button for keybind
+                keybind_record_btn = tk.Button(
+                    dynamic_frame,
+                    text="Record",
+                    command=functools.partial(
+                        self._record_keybind, keybind_entry, keybind_var,
+                        functools.partial(self._queue_row_save, button_name)
+                    ),
+                    bg="#404040",
+                    fg="white",
+                    font=("Arial", 8),
+                    relief="flat",
+                    padx=5,
+                    pady=2,
+                    cursor="hand2"
+                )
+                return [keybind_label, keybind_entry, keybind_record_btn]
+
+            def build_launch_app_widgets():
+                app_path_label = tk.Label(
+                    dynamic_frame,
+                    text="App:",
+                    bg="#353535",
+                    fg="white",
+                    font=("Arial", 9)
+                )
 
-            output_mode_combo = ttk.Combobox(
-                dynamic_frame,
-                textvariable=output_var,
-                values=output_options,
-                width=20,
-                font=("Arial", 9)
-            )
+                # Clickable label that opens file dialog
+                app_name_label = tk.Label(
+                    dynamic_frame,
+                    text=app_display_name_var.get() or "Click to select app",
+                    bg="#404040",
+                    fg="white",
+                    font=("Arial", 9),
+                    relief="sunken",
+                    padx=5,
+                    pady=2,
+                    width=25,
+                    cursor="hand2"
+                )
 
-            # Set initial value for audio output
-            if output_mode == "cycle" or not output_device:
-                output_mode_combo.set("Cycle Through")
-            elif output_mode == "select" and output_device:
-                # Check if the device still exists in the list
-                if output_device in audio_devices:
-                    output_mode_combo.set(output_device)
-                else:
-                    output_mode_combo.set("Cycle Through")
-            else:
-                output_mode_combo.set("Cycle Through")
+                # Bind click to open file dialog and auto-save
+                def on_app_click(e):
+                    if self._browse_app_file(app_path_var, app_display_name_var, app_name_label):
+                        self._queue_row_save(button_name)
+
+                app_name_label.bind('<Button-1>', on_app_click)
+                return [app_path_label, app_name_label]
+
+            def build_switch_audio_output_widgets():
+                output_label = tk.Label(
+                    dynamic_frame,
+                    text="Device:",
+                    bg="#353535",
+                    fg="white",
+                    font=("Arial", 9)
+                )
 
-            # Refresh audio devices when dropdown is clicked
-            def on_dropdown_click(event):
-                self._refresh_audio_devices_dropdown(output_mode_combo)
+                # Get available audio devices
+                audio_devices = self._get_audio_output_devices()
+                output_options = ["Cycle Through"] + audio_devices
 
-            output_mode_combo.bind('<Button-1>', on_dropdown_click)
+                # Fall back to cycling if the saved device no longer exists
+                if output_var.get() not in output_options:
+                    output_var.set("Cycle Through")
 
-            # BIND AUTO-SAVE TO ALL ENTRIES
-            def auto_save_wrapper(e=None):
-                return self._auto_save_button_binding(
-                    button_name, action_combo, target_combo,
-                    keybind_var, app_path_var, app_display_name_var, output_mode_combo, output_mode_combo
+                output_mode_combo = ttk.Combobox(
+                    dynamic_frame,
+                    textvariable=output_var,
+                    values=output_options,
+                    width=20,
+                    font=("Arial", 9)
                 )
 
-            target_combo.bind('<<ComboboxSelected>>', auto_save_wrapper)
-            keybind_entry.bind('<FocusOut>', auto_save_wrapper)  # Auto-save when user types manually
-            keybind_entry.bind('<Return>', auto_save_wrapper)  # Auto-save on Enter key
-            output_mode_combo.bind('<<ComboboxSelected>>', auto_save_wrapper)
+                # Refresh audio devices when dropdown is clicked
+                def on_dropdown_click(event):
+                    self._refresh_audio_devices_dropdown(output_mode_combo)
 
+                output_mode_combo.bind('<Button-1>', on_dropdown_click)
+                self._tag_row_edit(output_mode_combo, button_name)
+                return [output_label, output_mode_combo]
 
-            # Bind click to open file dialog and auto-save
-            def on_app_click(e):
-                if self._browse_app_file(app_path_var, app_display_name_var, app_name_label):
-                    auto_save_wrapper()
-
-            app_name_label.bind('<Button-1>', on_app_click)
+            widget_builders = {
+                "mute": build_mute_widgets,
+                "keybind": build_keybind_widgets,
+                "launch_app": build_launch_app_widgets,
+                "switch_audio_output": build_switch_audio_output_widgets,
+            }
 
             # Show/hide elements based on action
             def on_action_change(event=None):
@@ -706,27 +1058,48 @@ class ConfigButtonSection:
 
                 action_name = self.helpers.normalize_action_name(action_var.get())
 
-                if action_name == "keybind":
-                    keybind_label.pack(side="left", padx=2)
-                    keybind_entry.pack(side="left", padx=2)
-                    keybind_record_btn.pack(side="left", padx=2)
-                elif action_name == "mute":
-                    target_label.pack(side="left", padx=2)
-                    target_combo.pack(side="left", padx=2)
-                elif action_name == "launch_app":
-                    app_path_label.pack(side="left", padx=2)
-                    app_name_label.pack(side="left", padx=2)
-                elif action_name == "switch_audio_output":
-                    output_label.pack(side="left", padx=2)
-                    output_mode_combo.pack(side="left", padx=2)
-
-            # BIND AUTO-SAVE TO ACTION COMBO AND CALL on_action_change
-            action_combo.bind('<<ComboboxSelected>>',
-                              lambda e: (on_action_change(e), auto_save_wrapper(e))
-                              )
+                builder = widget_builders.get(action_name)
+                if builder is None:
+                    return
+                if action_name not in built_widgets:
+                    built_widgets[action_name] = builder()
+                for widget in built_widgets[action_name]:
+                    widget.pack(side="left", padx=2)
+
+            # Update the dynamic widgets, then auto-save via the row edit tag
+            action_combo.bind('<<ComboboxSelected>>', on_action_change)
+            self._tag_row_edit(action_combo, button_name)
 
             on_action_change()  # Initial state
 
+            def apply_spec():
+                """Reload this row's widgets from row_data['spec']"""
+                spec = row_data['spec']
+
+                display_action = self.helpers.get_action_display_name(spec['action']) if spec['action'] else ''
+                action_combo.set(display_action if display_action in actions else '')
+
+                target_var.set(self.helpers.get_display_name(spec['target']) if spec['target'] else '')
+                keybind_var.set(spec['keybind'] if isinstance(spec['keybind'], str) else '')
+
+                if spec['app_path'] and isinstance(spec['app_path'], str):
+                    app_path_var.set(spec['app_path'])
+                    app_display_name_var.set(spec['app_display_name'] or os.path.basename(spec['app_path']))
+                else:
+                    app_path_var.set('')
+                    app_display_name_var.set('')
+                if "launch_app" in built_widgets:
+                    built_widgets["launch_app"][1].config(text=app_display_name_var.get() or "Click to select app")
+
+                if spec['output_mode'] == "select" and spec['output_device']:
+                    output_var.set(spec['output_device'])
+                else:
+                    output_var.set("Cycle Through")
+
+                on_action_change()
+
+            row_data['apply_spec'] = apply_spec
+
             # Button container
             btn_frame = tk.Frame(row_frame, bg="#353535")
             btn_frame.grid(row=0, column=5, padx=2, sticky="e")
@@ -735,12 +1108,8 @@ class ConfigButtonSection:
             test_btn = tk.Button(
                 btn_frame,
                 text="Test",
-                command=lambda: self._test_button_action(
-                    self.helpers.normalize_action_name(action_var.get()),
-                    self.helpers.normalize_target_name(target_var.get()) if target_var.get() else "",
-                    keybind_var.get(),  # Changed from keybind_entry.get()
-                    app_path_var.get() if app_path_var else "",
-                    output_var.get()
+                command=functools.partial(
+                    self._on_test_click, action_var, target_var, keybind_var, app_path_var, output_var
                 ),
                 bg="#404040",
                 fg="white",
@@ -756,7 +1125,9 @@ class ConfigButtonSection:
             clear_btn = tk.Button(
                 btn_frame,
                 text="Clear",
-                command=lambda: self._clear_button_binding(button_name, row_frame, action_combo, dynamic_frame),
+                command=functools.partial(
+                    self._clear_button_binding, button_name, row_frame, action_combo, dynamic_frame
+                ),
                 bg="#5c1a1a",
                 fg="white",
                 font=("Arial", 9),
@@ -774,9 +1145,7 @@ class ConfigButtonSection:
         """Record keypresses for keybind configuration"""
         try:
             # Check if keyboard module is available
-            try:
-                import keyboard
-            except ImportError:
+            if keyboard is None:
                 messagebox.showerror(
                     "Module Missing",
                     "The 'keyboard' module is required for keybind recording.\n\n"
@@ -791,79 +1160,105 @@ class ConfigButtonSection:
 
             # Visual feedback - recording mode
             entry_widget.configure(background="#4a4a00", state="readonly")
-            keybind_var.set("Recording... (ESC to cancel)")
+            keybind_var.set(_RECORDING_PROMPT)
 
-            recorded_keys = []
+            recorded_keys = {}  # ordered set of normalized key names
             is_recording = True
             recording_complete = False
 
-            def on_key_event(event):
-                nonlocal is_recording, recorded_keys, recording_complete
+            # The keyboard hook runs on the keyboard library's thread; it only
+            # queues (event_type, name) pairs, which drain_events() applies on
+            # the Tk thread
+            key_events = queue.Queue()
+
+            # Tk after() ids: the event drain, the queued finalize check and
+            # the safety timeout
+            drain_after_id = None
+            finalize_after_id = None
+            timeout_after_id = None
+
+            def cancel_timers():
+                nonlocal drain_after_id, finalize_after_id, timeout_after_id
+                for after_id in (drain_after_id, finalize_after_id, timeout_after_id):
+                    if after_id is not None:
+                        entry_widget.after_cancel(after_id)
+                drain_after_id = None
+                finalize_after_id = None
+                timeout_after_id = None
+
+            def on_key_event(key_name):
+                nonlocal is_recording, recording_complete
 
                 if not is_recording or recording_complete:
                     return
 
-                key_name = event.name
-
                 # Handle escape to cancel
                 if key_name == 'esc':
                     is_recording = False
                     recording_complete = True
+                    cancel_timers()
                     keybind_var.set(original_value)
                     entry_widget.configure(background=original_bg, state=original_state)
-                    keyboard.unhook_all()
+                    keyboard.unhook(on_keyboard_event)
                     return
 
-                # Normalize key names for better display and compatibility
-                key_map = {
-                    'ctrl': 'ctrl',
-                    'control': 'ctrl',
-                    'shift': 'shift',
-                    'alt': 'alt',
-                    'win': 'win',
-                    'windows': 'win',
-                    'cmd': 'cmd',
-                    'command': 'cmd',
-                    'space': 'space',
-                    'enter': 'enter',
-                    'return': 'enter',
-                    'tab': 'tab',
-                    'backspace': 'backspace',
-                    'delete': 'delete',
-                    'del': 'delete',
-                    'up': 'up',
-                    'down': 'down',
-                    'left': 'left',
-                    'right': 'right',
-                    'page up': 'page up',
-                    'page down': 'page down',
-                    'home': 'home',
-                    'end': 'end',
-                    'insert': 'insert',
-                }
-
-                normalized_key = key_map.get(key_name.lower(), key_name.lower())
-
-                # Add key if not already in list (avoid duplicates from hold)
-                if normalized_key not in recorded_keys:
-                    recorded_keys.append(normalized_key)
-
-                # Display current combination with recording indicator
-                display_text = '+'.join(recorded_keys)
-                keybind_var.set(f"{display_text}")
-
-            def on_key_release(event):
-                nonlocal is_recording, recording_complete
+                # Normalize key names for better display and compatibility.
+                # The keyboard library reports most names in lowercase already,
+                # so only lowercase when the direct lookup misses
+                normalized_key = _KEY_NORMALIZATION_MAP.get(key_name)
+                if normalized_key is None:
+                    key_name = key_name.lower()
+                    normalized_key = _KEY_NORMALIZATION_MAP.get(key_name, key_name)
+
+                # Add key if not already recorded (avoid duplicates from hold);
+                # dict keys keep press order. Extra keys past the cap are ignored
+                if normalized_key in recorded_keys or len(recorded_keys) >= _MAX_CHORD_KEYS:
+                    return
+                recorded_keys[normalized_key] = None
+
+            def on_key_release():
+                nonlocal finalize_after_id
 
                 if not is_recording or recording_complete:
                     return
 
-                # Stop recording after a short delay when all keys are released
-                entry_widget.after(400, finalize_recording)
+                # Stop recording after a short delay when all keys are released;
+                # each release re-arms the one pending check
+                if finalize_after_id is not None:
+                    entry_widget.after_cancel(finalize_after_id)
+                finalize_after_id = entry_widget.after(400, finalize_recording)
+
+            def drain_events():
+                nonlocal drain_after_id
+
+                drain_after_id = None
+                pressed = False
+                try:
+                    while not recording_complete:
+                        try:
+                            event_type, key_name = key_events.get_nowait()
+                        except queue.Empty:
+                            break
+                        if event_type != keyboard.KEY_DOWN:
+                            on_key_release()
+                        elif key_name:
+                            # Unmapped scan codes are reported without a name
+                            on_key_event(key_name)
+                            pressed = True
+                finally:
+                    # Keep draining even if one event failed, so later
+                    # releases still finalize the recording
+                    if not recording_complete:
+                        # Display current combination; one update per batch of presses
+                        if pressed:
+                            keybind_var.set('+'.join(recorded_keys))
+
+                        drain_after_id = entry_widget.after(10, drain_events)
 
             def finalize_recording():
-                nonlocal is_recording, recording_complete
+                nonlocal is_recording, recording_complete, finalize_after_id
 
+                finalize_after_id = None
                 if not is_recording or recording_complete:
                     return
 
@@ -877,13 +1272,14 @@ class ConfigButtonSection:
 
                 is_recording = False
                 recording_complete = True
-                keyboard.unhook_all()
+                cancel_timers()
+                keyboard.unhook(on_keyboard_event)
 
                 # Restore state
                 entry_widget.configure(background=original_bg, state=original_state)
 
                 # Save the recorded keybind
-                if recorded_keys and recorded_keys != ['esc']:
+                if recorded_keys and list(recorded_keys) != ['esc']:
                     final_keybind = '+'.join(recorded_keys)
                     keybind_var.set(final_keybind)
 
@@ -892,17 +1288,23 @@ class ConfigButtonSection:
                 else:
                     keybind_var.set(original_value)
 
-            # Hook keyboard events
-            keyboard.on_press(on_key_event)
-            keyboard.on_release(on_key_release)
+            # Hook keyboard events: one hook for presses and releases, removed
+            # on its own so other keyboard hooks in the app are left alone
+            def on_keyboard_event(event):
+                key_events.put((event.event_type, event.name))
+
+            keyboard.hook(on_keyboard_event)
+            drain_after_id = entry_widget.after(10, drain_events)
 
             # Safety timeout - stop recording after 10 seconds
             def safety_timeout():
-                nonlocal is_recording, recording_complete
+                nonlocal is_recording, recording_complete, timeout_after_id
+                timeout_after_id = None
                 if is_recording and not recording_complete:
                     is_recording = False
                     recording_complete = True
-                    keyboard.unhook_all()
+                    cancel_timers()
+                    keyboard.unhook(on_keyboard_event)
                     entry_widget.configure(background=original_bg, state=original_state)
                     if recorded_keys:
                         final_keybind = '+'.join(recorded_keys)
@@ -911,7 +1313,7 @@ class ConfigButtonSection:
                     else:
                         keybind_var.set(original_value)
 
-            entry_widget.after(10000, safety_timeout)
+            timeout_after_id = entry_widget.after(10000, safety_timeout)
 
         except Exception as e:
             log_error(e, "Error recording keybind")
@@ -923,36 +1325,34 @@ class ConfigButtonSection:
             except:
                 pass
 
+    def _on_test_click(self, action_var, target_var, keybind_var, app_path_var, output_var):
+        """Test button handler: read the row's current values and test them"""
+        target = target_var.get()
+        self._test_button_action(
+            self.helpers.normalize_action_name(action_var.get()),
+            self.helpers.normalize_target_name(target) if target else "",
+            keybind_var.get(),
+            app_path_var.get(),
+            output_var.get()
+        )
+
+    def _get_action_handler(self):
+        """ActionHandler for test clicks, rebuilt only if the audio manager changes"""
+        if self._action_handler is None or self._action_handler.audio_manager is not self.audio_manager:
+            from utils.actions import ActionHandler
+            self._action_handler = ActionHandler(self.audio_manager)
+        return self._action_handler
+
     def _test_button_action(self, action, target, keybind, app_path, output_selection):
         """Test a button action (handles async actions properly)"""
         try:
-            from utils.actions import ActionHandler
-
-            action_handler = ActionHandler(self.audio_manager)
+            action_handler = self._get_action_handler()
 
-            kwargs = {}
-            if action == "mute" and target:
-                kwargs['target'] = target
-            elif action == "keybind" and keybind:
-                # Clean the keybind value - remove mic emoji if present
-                clean_keybind = keybind.strip()
-                # if clean_keybind.startswith("🎙️"):
-                #    clean_keybind = clean_keybind.replace("🎙️", "").strip()
-
-                # Don't test if it's still a recording message
-                if not clean_keybind or "Recording" in clean_keybind or "ESC to cancel" in clean_keybind:
-                    messagebox.showwarning("Test", "Please finish recording or enter a keybind first")
-                    return
-
-                kwargs['keys'] = clean_keybind
-            elif action == "launch_app" and app_path:
-                kwargs['app_path'] = app_path
-            elif action == "switch_audio_output":
-                if output_selection == "Cycle Through":
-                    kwargs['output_mode'] = 'cycle'
-                else:
-                    kwargs['output_mode'] = 'select'
-                    kwargs['device_name'] = output_selection
+            builder = _TEST_KWARG_BUILDERS.get(action)
+            kwargs = builder(target, keybind, app_path, output_selection) if builder else {}
+            if kwargs is None:
+                messagebox.showwarning("Test", "Please finish recording or enter a keybind first")
+                return
 
             success = action_handler.execute_action(action, **kwargs)
 
@@ -972,15 +1372,23 @@ class ConfigButtonSection:
         """Clear a button binding (set to empty action) instead of deleting"""
         try:
             if button_name:
+                # Drop any queued auto-save so it cannot overwrite the clear
+                self._cancel_pending_save(button_name)
+
                 # Clear the binding in config
-                self.config_manager.add_button_binding(button_name, {})
+                if self.config_manager.add_button_binding(button_name, {}):
+                    self._record_saved_binding(button_name, {})
 
                 # Clear the UI
                 action_combo.set('')
 
-                # Clear dynamic frame
+                # Free the per-action widgets; they are rebuilt lazily if an
+                # action is selected again
                 for widget in dynamic_frame.winfo_children():
-                    widget.pack_forget()
+                    widget.destroy()
+                row_data = self.button_binding_rows.get(button_name)
+                if row_data is not None and 'built_widgets' in row_data:
+                    row_data['built_widgets'].clear()
 
         except Exception as e:
             log_error(e, "Error clearing button binding")
\ No newline at end of file
@@ -129,8 +129,9 @@ class ConfigTab:
 
             # 2. Refresh Button Bindings (Mute target comboboxes)
             if self.button_section:
+                self.button_section.invalidate_action_caches()
                 # The target combo is inside dynamic_frame which is inside the row_frame (widget)
-                for row_frame in self.button_section.button_container.winfo_children():
+                for row_frame in self.button_section.button_canvas.winfo_children():
                     if isinstance(row_frame, tk.Frame):
                         # Find the dynamic_frame (column 5)
                         for dynamic_frame in row_frame.grid_slaves(column=5):
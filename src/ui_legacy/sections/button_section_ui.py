@@ -9,12 +9,25 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
 from utils.error_handler import log_error
-from ui.components import StyledLabelFrame, StyledFrame, ScrollableFrame, StyledCombobox, StyledButton
+from ui.components import (
+    StyledLabelFrame, StyledFrame, ScrollableFrame, StyledCombobox, StyledButton,
+    bind_canvas_mousewheel,
+)
 
 
 class ButtonSectionUI:
     """Button bindings section UI with handler-based logic"""
 
+    __slots__ = (
+        'handler',
+        'frame',
+        'button_binding_rows',
+        '_actions_cache',
+        '_action_display_names',
+        'button_canvas',
+        'button_container',
+    )
+
     def __init__(self, parent, handler):
         """
         Initialize button section UI
@@ -27,6 +40,13 @@ class ButtonSectionUI:
         self.frame = None
         self.button_binding_rows = {}
 
+        # Action dropdown values and internal name -> display name, shared by rows
+        self._actions_cache = tuple(handler.get_available_actions())
+        self._action_display_names = {
+            handler.normalize_action_name(display_name): display_name
+            for display_name in self._actions_cache
+        }
+
         # UI components
         self.button_canvas = None
         self.button_container = None
@@ -86,12 +106,7 @@ class ButtonSectionUI:
 
         self.button_container = StyledFrame(self.button_canvas)
 
-        self.button_container.bind(
-            "<Configure>",
-            lambda e: self.button_canvas.configure(
-                scrollregion=self.button_canvas.bbox("all")
-            )
-        )
+        self.button_container.bind("<Configure>", self._on_container_configure)
 
         self.button_canvas.create_window(
             (0, 0),
@@ -103,25 +118,12 @@ class ButtonSectionUI:
         self.button_canvas.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
 
-        # Mouse wheel scrolling
-        self._bind_mousewheel()
+        # Mouse wheel scrolling; the handler checks the pointer
+        bind_canvas_mousewheel(self.button_canvas)
 
-    def _bind_mousewheel(self):
-        """Bind mousewheel scrolling"""
-        def on_enter(e):
-            self.button_canvas.bind_all('<MouseWheel>', self._on_mousewheel)
-
-        def on_leave(e):
-            self.button_canvas.unbind_all('<MouseWheel>')
-
-        self.button_canvas.bind('<Enter>', on_enter)
-        self.button_canvas.bind('<Leave>', on_leave)
-        self.button_container.bind('<Enter>', on_enter)
-        self.button_container.bind('<Leave>', on_leave)
-
-    def _on_mousewheel(self, event):
-        """Handle mousewheel scrolling"""
-        self.button_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+    def _on_container_configure(self, event):
+        """Size the scroll region to the container (the canvas' only item)"""
+        self.button_canvas.configure(scrollregion=(0, 0, event.width, event.height))
 
     def _register_callbacks(self):
         """Register callbacks with handler"""
@@ -150,32 +152,43 @@ class ButtonSectionUI:
         try:
             required_buttons, config_buttons, _ = self.handler.get_required_buttons()
 
-            # Remove extra rows
-            rows_to_remove = []
-            for button_name in list(self.button_binding_rows.keys()):
-                if button_name.startswith('b'):
-                    button_num = int(button_name[1:])
-                    if button_num not in required_buttons:
-                        rows_to_remove.append(button_name)
-
-            for button_name in rows_to_remove:
-                row_data = self.button_binding_rows[button_name]
-                row_data['frame'].destroy()
-                del self.button_binding_rows[button_name]
-
-            # Create missing rows
-            for button_num in sorted(required_buttons):
+            # Existing "bN" rows by button number, parsed once
+            existing = {
+                int(button_name[1:]): button_name
+                for button_name in self.button_binding_rows
+                if button_name[:1] == 'b' and button_name[1:].isdigit()
+            }
+
+            # Remove extra rows: unpack now, destroy together once idle
+            stale_frames = [
+                self.button_binding_rows.pop(existing[button_num])['frame']
+                for button_num in existing.keys() - required_buttons
+            ]
+            if stale_frames:
+                for frame in stale_frames:
+                    frame.pack_forget()
+                self.button_container.after_idle(self._destroy_frames, stale_frames)
+
+            # Create missing rows. Packing is cheap here: Tk computes geometry
+            # at idle time, so the container gets one <Configure> (and one
+            # scroll-region update) for the whole batch, not one per row
+            for button_num in sorted(required_buttons - existing.keys()):
                 button_name = f"b{button_num}"
-                if button_name not in self.button_binding_rows:
-                    display_name = f"Button {button_num}"
-                    binding_data = self.handler.load_button_binding(button_name)
-                    is_auto = (button_num <= device_button_count and
-                              button_num not in config_buttons)
-                    self._add_button_row(button_name, display_name, binding_data, is_auto)
+                display_name = f"Button {button_num}"
+                binding_data = self.handler.load_button_binding(button_name)
+                is_auto = (button_num <= device_button_count and
+                          button_num not in config_buttons)
+                self._add_button_row(button_name, display_name, binding_data, is_auto)
 
         except Exception as e:
             log_error(e, "Error synchronizing button bindings")
 
+    @staticmethod
+    def _destroy_frames(frames):
+        """Destroy removed row frames in one pass"""
+        for frame in frames:
+            frame.destroy()
+
     def _add_button_row(self, button_name, display_name, binding_data, is_auto=False):
         """
         Add a button binding row
@@ -212,9 +225,13 @@ class ButtonSectionUI:
         label.pack(side="left", padx=5)
 
         # Add action selector
-        actions = self.handler.get_available_actions()
-        action_combo = StyledCombobox(row_frame, values=actions, width=20)
-        action_combo.set(self.handler.get_action_display_name(binding_data['action']))
+        action = binding_data['action']
+        display_action = self._action_display_names.get(action)
+        if display_action is None:
+            display_action = self.handler.get_action_display_name(action)
+
+        action_combo = StyledCombobox(row_frame, values=self._actions_cache, width=20)
+        action_combo.set(display_action)
         action_combo.pack(side="left", padx=5)
 
         # Save button
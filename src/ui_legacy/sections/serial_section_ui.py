@@ -7,6 +7,15 @@ from ui.components import StyledLabelFrame, StyledFrame, StyledButton
 class SerialSectionUI:
     """Handles the Serial Port Configuration UI"""
 
+    __slots__ = (
+        'handler',
+        'frame',
+        'serial_status_label',
+        'serial_details_label',
+        'start_in_tray',
+        'start_on_windows_start',
+    )
+
     def __init__(self, parent, handler):
         """
         Initialize serial section UI
@@ -157,21 +166,22 @@ class SerialSectionUI:
 
             # For reconnected status, show temporary message then revert
             if status == "reconnected":
-                self.serial_status_label.after(
-                    3000,
-                    lambda: self._update_status_display(
-                        "connected",
-                        {
-                            "text": "● Connected",
-                            "color": "#00ff00",
-                            "details": self.handler.get_connection_details()
-                        }
-                    )
-                )
+                self.serial_status_label.after(3000, self._revert_to_connected)
 
         except Exception as e:
             log_error(e, "Error updating status display")
 
+    def _revert_to_connected(self):
+        """Replace the temporary 'reconnected' message with the connected status"""
+        self._update_status_display(
+            "connected",
+            {
+                "text": "● Connected",
+                "color": "#00ff00",
+                "details": self.handler.get_connection_details()
+            }
+        )
+
     def _on_tray_setting_change(self):
         """Handle tray setting change"""
         self.handler.set_start_in_tray(self.start_in_tray.get())
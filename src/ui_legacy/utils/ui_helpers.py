@@ -1,7 +1,86 @@
 """UI Helper functions for configuration"""
+import os
+
 from utils.error_handler import log_error
 
 
+# (display name, internal name) for each action offered in the binding
+# dropdowns, in display order. The lookup tables below are derived from it.
+_ACTIONS = (
+    ("Play/Pause", "play_pause"),
+    ("Next Track", "next_track"),
+    ("Previous Track", "previous_track"),
+    ("Seek Forward", "seek_forward"),
+    ("Seek Backward", "seek_backward"),
+    ("Volume Up", "volume_up"),
+    ("Volume Down", "volume_down"),
+    ("Mute", "mute"),
+    ("Switch Audio Output", "switch_audio_output"),
+    ("Keybind (Custom)", "keybind"),
+    ("Launch App", "launch_app"),
+)
+
+_AVAILABLE_ACTIONS = tuple(display for display, _ in _ACTIONS)
+
+_ACTION_DISPLAY_TO_INTERNAL = dict(_ACTIONS)
+
+# Also names actions that older configs may hold but the dropdown no longer offers
+_ACTION_INTERNAL_TO_DISPLAY = {internal: display for display, internal in _ACTIONS}
+_ACTION_INTERNAL_TO_DISPLAY.update({
+    "play": "Play",
+    "pause": "Pause",
+})
+
+
+# Built-in binding targets, listed ahead of running apps in target dropdowns
+_SPECIAL_TARGETS_ORDERED = (
+    "Master",
+    "Microphone",
+    "System Sounds",
+    "Current Application",
+    "Unbound",
+    "None",
+)
+
+# Divider between the special targets and running apps in target dropdowns
+_TARGET_SEPARATOR = "─" * 30
+
+# Dropdown entries starting with these are separators/placeholders, not targets
+_PLACEHOLDER_PREFIXES = ("─", "(")
+
+# Special targets may be bound to several variables at once
+_SPECIAL_TARGETS = frozenset(_SPECIAL_TARGETS_ORDERED)
+
+
+
+def _index_app_bindings(bindings):
+    """
+    Invert variable bindings into app name -> set of variable names
+
+    Args:
+        bindings: The config's variable_bindings dict
+
+    Returns:
+        Dict mapping each bound app name to the variables bound to it
+    """
+    index = {}
+    for name, details in bindings.items():
+        # Handle multiple formats
+        if isinstance(details, dict):
+            bound_apps = details.get('app_name', [])
+        elif isinstance(details, list):
+            bound_apps = details
+        else:
+            bound_apps = [details] if details else []
+
+        if isinstance(bound_apps, str):
+            bound_apps = [bound_apps]
+
+        for bound_app in bound_apps:
+            index.setdefault(bound_app, set()).add(name)
+    return index
+
+
 class UIHelpers:
     """Utility methods for UI configuration"""
 
@@ -15,22 +94,12 @@ class UIHelpers:
         """
         self.audio_manager = audio_manager
         self.config_manager = config_manager
+        self._bindings_cache = None  # (config file mtime_ns, app -> variables index)
+        self._sorted_apps_cache = None  # (running app names, same names sorted)
 
     def get_available_actions(self):
-        """Get list of available actions"""
-        return [
-            "Play/Pause",
-            "Next Track",
-            "Previous Track",
-            "Seek Forward",
-            "Seek Backward",
-            "Volume Up",
-            "Volume Down",
-            "Mute",
-            "Switch Audio Output",
-            "Keybind (Custom)",
-            "Launch App"
-        ]
+        """Get available actions (shared tuple; do not mutate)"""
+        return _AVAILABLE_ACTIONS
 
     def normalize_action_name(self, display_name):
         """
@@ -42,20 +111,7 @@ class UIHelpers:
         Returns:
             Internal action name (e.g., "play_pause")
         """
-        action_map = {
-            "Play/Pause": "play_pause",
-            "Next Track": "next_track",
-            "Previous Track": "previous_track",
-            "Seek Forward": "seek_forward",
-            "Seek Backward": "seek_backward",
-            "Volume Up": "volume_up",
-            "Volume Down": "volume_down",
-            "Mute": "mute",
-            "Switch Audio Output": "switch_audio_output",
-            "Keybind (Custom)": "keybind",
-            "Launch App": "launch_app"
-        }
-        return action_map.get(display_name.strip(), display_name)
+        return _ACTION_DISPLAY_TO_INTERNAL.get(display_name.strip(), display_name)
 
     def get_action_display_name(self, internal_name):
         """
@@ -67,51 +123,29 @@ class UIHelpers:
         Returns:
             Display name (e.g., "Play/Pause")
         """
-        display_map = {
-            "play_pause": "Play/Pause",
-            "play": "Play",
-            "pause": "Pause",
-            "next_track": "Next Track",
-            "previous_track": "Previous Track",
-            "seek_forward": "Seek Forward",
-            "seek_backward": "Seek Backward",
-            "volume_up": "Volume Up",
-            "volume_down": "Volume Down",
-            "mute": "Mute",
-            "switch_audio_output": "Switch Audio Output",
-            "keybind": "Keybind (Custom)",
-            "launch_app": "Launch App"
-        }
-        return display_map.get(internal_name, internal_name)
+        return _ACTION_INTERNAL_TO_DISPLAY.get(internal_name, internal_name)
 
     def get_available_targets(self):
         """Get list of available binding targets"""
         try:
-            targets = [
-                "Master",
-                "Microphone",
-                "System Sounds",
-                "Current Application",
-                "Unbound",
-                "None"
-            ]
-
-            targets.append("─" * 30)
-
             apps = self.audio_manager.get_all_audio_apps()
 
             if apps:
-                for app_name in sorted(apps.keys()):
-                    targets.append(f"{app_name}")
+                # Re-sort only when the set of running apps changed
+                app_names = frozenset(apps)
+                cached = self._sorted_apps_cache
+                if cached is None or cached[0] != app_names:
+                    cached = (app_names, tuple(sorted(app_names)))
+                    self._sorted_apps_cache = cached
+                app_targets = cached[1]
             else:
-                targets.append("(No audio apps running)")
+                app_targets = ("(No audio apps running)",)
 
-            return targets
+            return [*_SPECIAL_TARGETS_ORDERED, _TARGET_SEPARATOR, *app_targets]
 
         except Exception as e:
             log_error(e, "Error getting available targets")
-            return ["Master", "Microphone", "System Sounds",
-                    "Current Application", "Unbound", "None"]
+            return list(_SPECIAL_TARGETS_ORDERED)
 
     def normalize_target_name(self, display_name):
         """
@@ -129,7 +163,7 @@ class UIHelpers:
         name = display_name.strip()
         
         # Handle separator/placeholder
-        if name.startswith("─") or name.startswith("("):
+        if name.startswith(_PLACEHOLDER_PREFIXES):
             return ""
 
         return name
@@ -149,10 +183,39 @@ class UIHelpers:
 
         return internal_name.strip()
 
+    def _get_app_binding_index(self):
+        """
+        Get the app -> bound variables index, rebuilt only when the config changed
+
+        Returns:
+            Dict of app name -> set of variable names (shared; do not mutate)
+        """
+        if self.config_manager.has_changes:
+            # Unsaved edits are not reflected in the file's mtime yet
+            return _index_app_bindings(self.config_manager.config.get('variable_bindings', {}))
+
+        try:
+            mtime = os.stat(self.config_manager.config_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._bindings_cache
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return cached[1]
+
+        config = self.config_manager.load_config()
+        index = _index_app_bindings(config.get('variable_bindings', {}))
+        self._bindings_cache = (mtime, index)
+        return index
+
     def check_duplicate_binding(self, var_name, app_name):
         """
         Check if a variable binding already exists for the app
 
+        Empty and special targets return before any config access; other
+        apps are looked up in the cached app index, so the config file is
+        only re-read when it changed on disk.
+
         Args:
             var_name: Variable name to exclude from check
             app_name: App name to check for duplicates
@@ -161,33 +224,16 @@ class UIHelpers:
             True if duplicate binding exists, False otherwise
         """
         try:
-            # Special targets that can be bound multiple times
-            special_targets = ["Master", "Microphone", "System Sounds",
-                             "Current Application", "Unbound", "None"]
-
-            if not app_name or app_name in special_targets:
+            # Special targets can be bound multiple times
+            if not app_name or app_name in _SPECIAL_TARGETS:
                 return False
 
-            config = self.config_manager.load_config()
-            bindings = config.get('variable_bindings', {})
-
-            for name, details in bindings.items():
-                if name != var_name:  # Don't check against self
-                    # Handle multiple formats
-                    if isinstance(details, dict):
-                        bound_apps = details.get('app_name', [])
-                    elif isinstance(details, list):
-                        bound_apps = details
-                    else:
-                        bound_apps = [details] if details else []
-
-                    if isinstance(bound_apps, str):
-                        bound_apps = [bound_apps]
-
-                    if app_name in bound_apps:
-                        return True
+            bound_vars = self._get_app_binding_index().get(app_name)
+            if not bound_vars:
+                return False
 
-            return False
+            # Don't check against self
+            return len(bound_vars) > 1 or var_name not in bound_vars
 
         except Exception as e:
             log_error(e, "Error checking duplicate binding")
@@ -1,10 +1,21 @@
+import functools
+import json
+import os
 import subprocess
+import threading
 import time
 import platform
-from utils.error_handler import log_error
+from utils.error_handler import log_error, get_app_data_folder
+
+_IS_WINDOWS = platform.system() == "Windows"
+
+# A successful AudioDeviceCmdlets probe is remembered on disk for this long,
+# so app starts skip the PowerShell check (seconds)
+AUDIO_CMDLETS_CACHE_TTL_S = 24 * 60 * 60
+AUDIO_CMDLETS_CACHE_FILE = "audio_cmdlets_cache.json"
 
 # Windows-specific: Hide console windows
-if platform.system() == "Windows":
+if _IS_WINDOWS:
     startupinfo = subprocess.STARTUPINFO()
     startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
     startupinfo.wShowWindow = subprocess.SW_HIDE
@@ -13,6 +24,194 @@ else:
     startupinfo = None
     CREATE_NO_WINDOW = 0
 
+# Windows-specific: SendInput lets a key's down and up events be queued in
+# one call, with no sleep in between (see _send_key_taps)
+_SendInput = None
+if _IS_WINDOWS:
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        _INPUT_KEYBOARD = 1
+        _KEYEVENTF_KEYUP = 0x0002
+
+        class _KEYBDINPUT(ctypes.Structure):
+            _fields_ = [
+                ("wVk", wintypes.WORD),
+                ("wScan", wintypes.WORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t),
+            ]
+
+        class _MOUSEINPUT(ctypes.Structure):
+            # Only here so the INPUT union has its full Windows size
+            _fields_ = [
+                ("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t),
+            ]
+
+        class _INPUTUNION(ctypes.Union):
+            _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+        class _INPUT(ctypes.Structure):
+            _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+        _SendInput = ctypes.windll.user32.SendInput
+        _SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+        _SendInput.restype = wintypes.UINT
+        _MapVirtualKeyW = ctypes.windll.user32.MapVirtualKeyW
+    except (ImportError, AttributeError, OSError):
+        _SendInput = None
+
+_KEYEVENTF_EXTENDEDKEY = 0x0001
+
+# Windows virtual-key codes for the fixed media actions
+_VK_MEDIA_NEXT_TRACK = 0xB0
+_VK_MEDIA_PREV_TRACK = 0xB1
+_VK_MEDIA_PLAY_PAUSE = 0xB3
+_VK_VOLUME_DOWN = 0xAE
+_VK_VOLUME_UP = 0xAF
+_VK_LEFT = 0x25
+_VK_RIGHT = 0x27
+
+# Key names (as recorded by the keybind UI) -> Windows virtual-key codes
+_VK_CODES = {
+    'ctrl': 0x11, 'shift': 0x10, 'alt': 0x12, 'win': 0x5B,
+    'left ctrl': 0xA2, 'right ctrl': 0xA3, 'left shift': 0xA0, 'right shift': 0xA1,
+    'left alt': 0xA4, 'right alt': 0xA5, 'left windows': 0x5B, 'right windows': 0x5C,
+    'space': 0x20, 'enter': 0x0D, 'tab': 0x09, 'backspace': 0x08, 'esc': 0x1B,
+    'insert': 0x2D, 'delete': 0x2E, 'home': 0x24, 'end': 0x23,
+    'page up': 0x21, 'page down': 0x22,
+    'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
+}
+_VK_CODES.update({chr(code).lower(): code for code in range(0x41, 0x5B)})  # a-z
+_VK_CODES.update({chr(code): code for code in range(0x30, 0x3A)})  # 0-9
+_VK_CODES.update({f'f{number}': 0x6F + number for number in range(1, 25)})  # f1-f24
+
+# Keys that must be sent with KEYEVENTF_EXTENDEDKEY
+_EXTENDED_VK_CODES = frozenset({
+    0x2D, 0x2E, 0x24, 0x23, 0x21, 0x22, 0x25, 0x26, 0x27, 0x28,
+    0xA3, 0xA5, 0x5B, 0x5C,
+})
+
+
+def _send_key_events(events):
+    """
+    Queue (vk_code, key_up) events with a single SendInput call
+
+    Returns:
+        True if every event was queued, False if SendInput is unavailable or failed
+    """
+    if _SendInput is None:
+        return False
+
+    inputs = (_INPUT * len(events))()
+    for event, (vk_code, key_up) in zip(inputs, events):
+        flags = _KEYEVENTF_KEYUP if key_up else 0
+        if vk_code in _EXTENDED_VK_CODES:
+            flags |= _KEYEVENTF_EXTENDEDKEY
+        event.type = _INPUT_KEYBOARD
+        event.u.ki.wVk = vk_code
+        event.u.ki.wScan = _MapVirtualKeyW(vk_code, 0)  # MAPVK_VK_TO_VSC
+        event.u.ki.dwFlags = flags
+
+    sent = _SendInput(len(inputs), inputs, ctypes.sizeof(_INPUT))
+    return sent == len(inputs)
+
+
+def _send_key_taps(vk_codes):
+    """Press and release each virtual key in order with a single SendInput call"""
+    events = []
+    for vk_code in vk_codes:
+        events.append((vk_code, False))
+        events.append((vk_code, True))
+    return _send_key_events(events)
+
+
+def _send_chord(keys):
+    """
+    Send a keybind like "ctrl+shift+a" with a single SendInput call
+
+    Keys go down in order and come up in reverse order.
+
+    Returns:
+        True if sent; False if SendInput is unavailable or a key has no
+        known virtual-key code (the caller should fall back to keyboard)
+    """
+    if _SendInput is None or ',' in keys:
+        return False
+
+    vk_codes = []
+    for name in keys.lower().split('+'):
+        vk_code = _VK_CODES.get(name.strip())
+        if vk_code is None:
+            return False
+        vk_codes.append(vk_code)
+
+    events = [(vk_code, False) for vk_code in vk_codes]
+    events.extend((vk_code, True) for vk_code in reversed(vk_codes))
+    return _send_key_events(events)
+
+
+def _audio_cmdlets_module_installed():
+    """
+    Look for an AudioDeviceCmdlets module folder on the PowerShell module paths
+
+    This is where Get-Module -ListAvailable looks, without starting PowerShell.
+    The per-user folders are added explicitly because PowerShell only puts
+    them on PSModulePath inside its own session.
+
+    Returns:
+        True if the module folder exists; False means "unknown", not "missing"
+    """
+    documents = os.path.join(os.path.expanduser('~'), 'Documents')
+    module_dirs = os.environ.get('PSModulePath', '').split(os.pathsep) + [
+        os.path.join(documents, 'WindowsPowerShell', 'Modules'),
+        os.path.join(documents, 'PowerShell', 'Modules'),
+    ]
+    return any(
+        os.path.isdir(os.path.join(module_dir, 'AudioDeviceCmdlets'))
+        for module_dir in module_dirs if module_dir
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_app_path(raw_path):
+    """
+    Clean a bound app path; buttons reuse the same path, so results are cached
+
+    Returns:
+        The stripped path without one matching pair of outer quotes
+        (empty if nothing is left)
+    """
+    path = raw_path.strip()
+
+    # Note: subprocess.Popen with shell=True handles quotes reasonably well usually,
+    # but we might want to clean just outer quotes if present (a matching
+    # pair only, so '"C:\\App\\app.exe" --flag' is left intact).
+    if len(path) >= 2 and path[0] == path[-1] and path[0] in '"\'':
+        path = path[1:-1]
+    return path
+
+
+def _catching(func):
+    """Decorate an action so exceptions are logged and reported as failure (False)"""
+    context = f"Error in {func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except Exception as e:
+            log_error(e, context)
+            return False
+    return wrapper
+
 
 class ActionHandler:
     """Handle all button actions"""
@@ -22,13 +221,35 @@ class ActionHandler:
         self._check_dependencies()
         self._audio_cmdlets_checked = False
         self._audio_cmdlets_available = False
+        self._audio_cmdlets_hint_shown = False
+        self._audio_cmdlets_lock = threading.Lock()
+
+        # Legacy/Internal function mapping, built once per handler
+        self._dispatch = {
+            'play_pause': self.play_pause,
+            'play': self.play,
+            'pause': self.pause,
+            'next_track': self.next_track,
+            'previous_track': self.previous_track,
+            'seek_forward': self.seek_forward,
+            'seek_backward': self.seek_backward,
+            'volume_up': self.volume_up,
+            'volume_down': self.volume_down,
+            'mute': self.mute,
+            'switch_audio_output': self.switch_audio_output,
+            'keybind': self.press_keybind,
+            'launch_app': self.launch_app,
+        }
 
     def _check_dependencies(self):
         """Check if required modules are available"""
+        # Modules are kept on the handler so actions don't re-import them
         try:
             import keyboard
+            self._keyboard = keyboard
             self.has_keyboard = True
         except ImportError:
+            self._keyboard = None
             self.has_keyboard = False
             log_error(
                 ImportError("keyboard module not available"),
@@ -38,13 +259,17 @@ class ActionHandler:
         try:
             import win32api
             import win32con
+            self._win32api = win32api
+            self._win32con_keyup = win32con.KEYEVENTF_KEYUP
             self.has_win32 = True
         except ImportError:
+            self._win32api = None
+            self._win32con_keyup = None
             self.has_win32 = False
 
     def _run_powershell_hidden(self, command, timeout=10):
         """Run PowerShell command with hidden window - same as output_switch.py"""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             si = subprocess.STARTUPINFO()
             si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             si.wShowWindow = subprocess.SW_HIDE
@@ -71,44 +296,107 @@ class ActionHandler:
                 timeout=timeout
             )
 
+    def prefetch_audio_cmdlets_check(self):
+        """
+        Run the AudioDeviceCmdlets check on a background thread
+
+        The first switch_audio_output then finds the answer ready instead of
+        waiting on PowerShell.
+        """
+        if not self._audio_cmdlets_checked:
+            threading.Thread(target=self._check_audio_cmdlets, daemon=True).start()
+
     def _check_audio_cmdlets(self):
         """Check if AudioDeviceCmdlets is installed on Windows"""
         if self._audio_cmdlets_checked:
             return self._audio_cmdlets_available
 
-        if platform.system() != "Windows":
-            self._audio_cmdlets_checked = True
-            self._audio_cmdlets_available = True
-            return True
+        # A prefetch may already be probing; wait for its answer
+        with self._audio_cmdlets_lock:
+            if not self._audio_cmdlets_checked:
+                self._probe_audio_cmdlets()
+        return self._audio_cmdlets_available
+
+    def _probe_audio_cmdlets(self):
+        """Probe for AudioDeviceCmdlets and record the result"""
+        if not _IS_WINDOWS:
+            return self._set_audio_cmdlets_result(True)
+
+        if self._read_audio_cmdlets_cache() or _audio_cmdlets_module_installed():
+            return self._set_audio_cmdlets_result(True)
 
         try:
             # Use simpler, faster command that won't timeout
             ps_command = "Get-Module -ListAvailable AudioDeviceCmdlets | Select-Object -First 1 -ExpandProperty Name"
             result = self._run_powershell_hidden(ps_command, timeout=8)
 
-            self._audio_cmdlets_checked = True
-            self._audio_cmdlets_available = (
+            available = (
                 result.returncode == 0 and
                 "AudioDeviceCmdlets" in result.stdout
             )
-            return self._audio_cmdlets_available
+            if available:
+                self._write_audio_cmdlets_cache()
+            return self._set_audio_cmdlets_result(available)
 
         except subprocess.TimeoutExpired:
             log_error(
                 TimeoutError("PowerShell command timed out"),
                 "AudioDeviceCmdlets check timed out - assuming not installed"
             )
-            self._audio_cmdlets_checked = True
-            self._audio_cmdlets_available = False
-            return False
+            return self._set_audio_cmdlets_result(False)
         except Exception as e:
             log_error(e, "Error checking AudioDeviceCmdlets")
-            self._audio_cmdlets_checked = True
-            self._audio_cmdlets_available = False
+            return self._set_audio_cmdlets_result(False)
+
+    def _set_audio_cmdlets_result(self, available):
+        """
+        Record the probe result
+
+        available is stored before checked: _check_audio_cmdlets reads both
+        without the lock once checked is set.
+        """
+        self._audio_cmdlets_available = available
+        self._audio_cmdlets_checked = True
+        return available
+
+    def _read_audio_cmdlets_cache(self):
+        """
+        Check the on-disk record of a recent successful AudioDeviceCmdlets probe
+
+        Only positive results are cached, so installing the module is noticed
+        on the next start.
+        """
+        try:
+            cache_path = os.path.join(get_app_data_folder(), AUDIO_CMDLETS_CACHE_FILE)
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return (
+                cached.get('available') is True and
+                time.time() - cached.get('checked_at', 0) < AUDIO_CMDLETS_CACHE_TTL_S
+            )
+        except (OSError, ValueError, AttributeError, TypeError):
             return False
 
+    def _write_audio_cmdlets_cache(self):
+        """Remember a successful AudioDeviceCmdlets probe on disk"""
+        try:
+            cache_path = os.path.join(get_app_data_folder(), AUDIO_CMDLETS_CACHE_FILE)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'available': True, 'checked_at': time.time()}, f)
+        except OSError as e:
+            log_error(e, "Error writing AudioDeviceCmdlets cache")
+
     def _show_audio_cmdlets_install_dialog(self):
-        """Show installation instructions for AudioDeviceCmdlets"""
+        """
+        Show installation instructions for AudioDeviceCmdlets
+
+        Printed once per handler and never blocks, so a switch-output press
+        from the serial thread returns straight away.
+        """
+        if self._audio_cmdlets_hint_shown:
+            return
+        self._audio_cmdlets_hint_shown = True
+
         message = """
 ========================================================================
 AudioDeviceCmdlets PowerShell module is not installed.
@@ -158,24 +446,7 @@ https://github.com/frgnca/AudioDeviceCmdlets
             # Resolve action type from map if possible
             action_type = self.ACTION_MAP.get(action_name, action_name)
             
-            # Legacy/Internal function mapping
-            func_map = {
-                'play_pause': self.play_pause,
-                'play': self.play,
-                'pause': self.pause,
-                'next_track': self.next_track,
-                'previous_track': self.previous_track,
-                'seek_forward': self.seek_forward,
-                'seek_backward': self.seek_backward,
-                'volume_up': self.volume_up,
-                'volume_down': self.volume_down,
-                'mute': self.mute,
-                'switch_audio_output': self.switch_audio_output,
-                'keybind': self.press_keybind,
-                'launch_app': self.launch_app,
-            }
-
-            action = func_map.get(action_type)
+            action = self._dispatch.get(action_type)
             if action:
                 return action(**kwargs)
             else:
@@ -186,198 +457,166 @@ https://github.com/frgnca/AudioDeviceCmdlets
             log_error(e, f"Error executing action: {action_name}")
             return False
 
+    @_catching
     def play_pause(self, **kwargs):
         """Toggle play/pause"""
-        try:
-            self._send_media_key(0xB3)
-            return True
-        except Exception as e:
-            log_error(e, "Error in play_pause")
-            return False
+        self._send_media_key(_VK_MEDIA_PLAY_PAUSE)
+        return True
 
+    @_catching
     def play(self, **kwargs):
         """Play"""
-        try:
-            if self.has_keyboard:
-                import keyboard
-                keyboard.press_and_release('play media')
-                return True
-            else:
-                self._send_media_key(0xB3)
-                return True
-        except Exception as e:
-            log_error(e, "Error in play")
-            return False
+        if self.has_keyboard:
+            self._keyboard.press_and_release('play media')
+            return True
+        else:
+            self._send_media_key(_VK_MEDIA_PLAY_PAUSE)
+            return True
 
+    @_catching
     def pause(self, **kwargs):
         """Pause"""
-        try:
-            if self.has_keyboard:
-                import keyboard
-                keyboard.press_and_release('pause media')
-                return True
-            else:
-                self._send_media_key(0xB3)
-                return True
-        except Exception as e:
-            log_error(e, "Error in pause")
-            return False
+        if self.has_keyboard:
+            self._keyboard.press_and_release('pause media')
+            return True
+        else:
+            self._send_media_key(_VK_MEDIA_PLAY_PAUSE)
+            return True
 
+    @_catching
     def next_track(self, **kwargs):
         """Next track"""
-        try:
-            self._send_media_key(0xB0)
-            return True
-        except Exception as e:
-            log_error(e, "Error in next_track")
-            return False
+        self._send_media_key(_VK_MEDIA_NEXT_TRACK)
+        return True
 
+    @_catching
     def previous_track(self, **kwargs):
         """Previous track"""
-        try:
-            self._send_media_key(0xB1)
-            return True
-        except Exception as e:
-            log_error(e, "Error in previous_track")
-            return False
+        self._send_media_key(_VK_MEDIA_PREV_TRACK)
+        return True
 
+    @_catching
     def seek_forward(self, seconds=5, **kwargs):
         """Seek forward (not all media players support this)"""
-        try:
-            if self.has_keyboard:
-                import keyboard
-                keyboard.press_and_release('right')
-                return True
-            else:
-                return False
-        except Exception as e:
-            log_error(e, "Error in seek_forward")
+        if _send_key_taps((_VK_RIGHT,)):
+            return True
+        if self.has_keyboard:
+            self._keyboard.press_and_release('right')
+            return True
+        else:
             return False
 
+    @_catching
     def seek_backward(self, seconds=5, **kwargs):
         """Seek backward (not all media players support this)"""
-        try:
-            if self.has_keyboard:
-                import keyboard
-                keyboard.press_and_release('left')
-                return True
-            else:
-                return False
-        except Exception as e:
-            log_error(e, "Error in seek_backward")
+        if _send_key_taps((_VK_LEFT,)):
+            return True
+        if self.has_keyboard:
+            self._keyboard.press_and_release('left')
+            return True
+        else:
             return False
 
+    @_catching
     def volume_up(self, **kwargs):
         """Volume up"""
-        try:
-            self._send_media_key(0xAF)
-            return True
-        except Exception as e:
-            log_error(e, "Error in volume_up")
-            return False
+        self._send_media_key(_VK_VOLUME_UP)
+        return True
 
+    @_catching
     def volume_down(self, **kwargs):
         """Volume down"""
-        try:
-            self._send_media_key(0xAE)
-            return True
-        except Exception as e:
-            log_error(e, "Error in volume_down")
-            return False
+        self._send_media_key(_VK_VOLUME_DOWN)
+        return True
 
+    @_catching
     def mute(self, **kwargs):
         """Toggle mute"""
-        try:
-            if not self.audio_manager:
-                return False
-
-            # Schema mapping:
-            # value = "Mute"
-            # argument = target (e.g. "Master", "Microphone", "Specific App Name")
-            
-            target = kwargs.get('argument') or kwargs.get('target')
-            
-            # Legacy/Fallback
-            if not target:
-                 target = 'Master'
-            
-            # Handle empty target as Master
-            if not target or target == "None":
-                target = "Master"
-
-            if target == "Master":
-                self.audio_manager.toggle_master_mute()
-            elif target == "Microphone":
-                self.audio_manager.toggle_mic_mute()
-            elif target == "System Sounds":
-                self.audio_manager.toggle_system_sounds_mute()
-            elif target == "Current Application":
-                self.audio_manager.toggle_current_app_mute()
-            elif target == "Unbound":
-                self.audio_manager.toggle_unbound_mute()
-            else:
-                # Specific app
-                self.audio_manager.toggle_app_mute(target)
-                
-            return True
-        except Exception as e:
-            log_error(e, "Error in mute")
+        if not self.audio_manager:
             return False
 
-    def switch_audio_output(self, output_mode="cycle", device_name=None, **kwargs):
-        """Switch audio output device"""
-        try:
-            # Check if AudioDeviceCmdlets is installed on Windows
-            if not self._check_audio_cmdlets():
-                self._show_audio_cmdlets_install_dialog()
-                return False
-
-            from audio.output_switch import (
-                cycle_audio_device,
-                set_audio_device,
-                get_device_names
-            )
-
-            # Schema mappping:
-            # value = "Switch Audio Output"
-            # argument = "Cycle Through" OR Device Name (for select mode)
-            
-            arg = kwargs.get('argument')
-            
-            # Determine mode based on argument
-            if arg == "Cycle Through" or arg is None:
-                final_mode = "cycle"
-                final_device = None
-            else:
-                final_mode = "select"
-                final_device = arg
-
-            # Allow direct overrides if provided via kwargs (legacy)
-            if kwargs.get('output_mode'): final_mode = kwargs.get('output_mode')
-            if device_name: final_device = device_name
-            
-            if final_mode == "cycle":
-                return cycle_audio_device()
-
-            elif final_mode == "select" and final_device:
-                # Verify device exists by checking available names
-                available_names = get_device_names()
+        # Schema mapping:
+        # value = "Mute"
+        # argument = target (e.g. "Master", "Microphone", "Specific App Name")
+
+        target = kwargs.get('argument') or kwargs.get('target')
+
+        # Legacy/Fallback
+        if not target:
+             target = 'Master'
+
+        # Handle empty target as Master
+        if not target or target == "None":
+            target = "Master"
+
+        if target == "Master":
+            self.audio_manager.toggle_master_mute()
+        elif target == "Microphone":
+            self.audio_manager.toggle_mic_mute()
+        elif target == "System Sounds":
+            self.audio_manager.toggle_system_sounds_mute()
+        elif target == "Current Application":
+            self.audio_manager.toggle_current_app_mute()
+        elif target == "Unbound":
+            self.audio_manager.toggle_unbound_mute()
+        else:
+            # Specific app
+            self.audio_manager.toggle_app_mute(target)
 
-                if not available_names:
-                    log_error(ValueError("No audio devices found"), "Cannot switch audio output")
-                    return False
+        return True
 
-                if final_device not in available_names:
-                    log_error(ValueError(f"Device not found: {final_device}"), "Cannot switch audio output")
-                    return False
+    @_catching
+    def switch_audio_output(self, output_mode="cycle", device_name=None, **kwargs):
+        """Switch audio output device"""
+        # Check if AudioDeviceCmdlets is installed on Windows
+        if not self._check_audio_cmdlets():
+            self._show_audio_cmdlets_install_dialog()
+            return False
 
-                return set_audio_device(final_device)
+        from audio.output_switch import (
+            cycle_audio_device,
+            set_audio_device,
+            get_devices_by_name
+        )
+
+        # Schema mappping:
+        # value = "Switch Audio Output"
+        # argument = "Cycle Through" OR Device Name (for select mode)
+        
+        arg = kwargs.get('argument')
+        
+        # Determine mode based on argument
+        if arg == "Cycle Through" or arg is None:
+            final_mode = "cycle"
+            final_device = None
+        else:
+            final_mode = "select"
+            final_device = arg
+
+        # Allow direct overrides if provided via kwargs (legacy)
+        if kwargs.get('output_mode'): final_mode = kwargs.get('output_mode')
+        if device_name: final_device = device_name
+        
+        if final_mode == "cycle":
+            return cycle_audio_device()
+
+        elif final_mode == "select" and final_device:
+            # Enumerate once and hand the matched device straight to
+            # set_audio_device, which would otherwise enumerate again
+            devices_by_name = get_devices_by_name()
+
+            if not devices_by_name:
+                log_error(ValueError("No audio devices found"), "Cannot switch audio output")
+                return False
 
-            else:
+            device = devices_by_name.get(final_device)
+            if device is None:
+                log_error(ValueError(f"Device not found: {final_device}"), "Cannot switch audio output")
                 return False
 
-        except Exception as e:
-            log_error(e, "Error switching audio output")
+            return set_audio_device(device)
+
+        else:
             return False
 
     def press_keybind(self, keys, **kwargs):
@@ -389,10 +628,7 @@ https://github.com/frgnca/AudioDeviceCmdlets
                     "Cannot execute keybind"
                 )
                 return False
-            
 
-            import keyboard
-            
             # Support generic binding structure
             if not keys:
                 keys = kwargs.get('value') or kwargs.get('argument')
@@ -400,7 +636,10 @@ https://github.com/frgnca/AudioDeviceCmdlets
             if not keys:
                 return False
                 
-            keyboard.press_and_release(keys)
+            if isinstance(keys, str) and _send_chord(keys):
+                return True
+
+            self._keyboard.press_and_release(keys)
             return True
 
         except Exception as e:
@@ -425,18 +664,19 @@ https://github.com/frgnca/AudioDeviceCmdlets
                 log_error(ValueError("No app path provided"), "Cannot launch app")
                 return False
 
-            path_to_use = path_to_use.strip()
+            path_to_use = _normalize_app_path(path_to_use)
 
             if not path_to_use:
                 log_error(ValueError("Empty app path provided"), "Cannot launch app")
                 return False
-            
-            # Note: subprocess.Popen with shell=True handles quotes reasonably well usually,
-            # but we might want to clean just outer quotes if present.
-            if path_to_use.startswith('"') and path_to_use.endswith('"'):
-                path_to_use = path_to_use[1:-1]
-            elif path_to_use.startswith("'") and path_to_use.endswith("'"):
-                path_to_use = path_to_use[1:-1]
+
+            # A plain file path opens through ShellExecute directly, without
+            # a cmd.exe in between. Commands with arguments, names resolved
+            # via PATH and batch files still need the shell.
+            if (_IS_WINDOWS and os.path.isfile(path_to_use) and
+                    not path_to_use.lower().endswith(('.bat', '.cmd'))):
+                os.startfile(path_to_use)
+                return True
 
             subprocess.Popen(path_to_use, shell=True)
             return True
@@ -445,20 +685,18 @@ https://github.com/frgnca/AudioDeviceCmdlets
             log_error(e, f"Error launching app: {app_path}")
             return False
 
-        except Exception as e:
-            log_error(e, f"Error launching app: {app_path}")
-            return False
-
     def _send_media_key(self, vk_code):
         """Send a media key using Windows API"""
         try:
-            if self.has_win32:
-                import win32api
-                import win32con
+            if _send_key_taps((vk_code,)):
+                return True
 
+            if self.has_win32:
+                # keybd_event queues input like SendInput, so the key-up
+                # can follow the key-down without a sleep
+                win32api = self._win32api
                 win32api.keybd_event(vk_code, 0, 0, 0)
-                time.sleep(0.05)
-                win32api.keybd_event(vk_code, 0, win32con.KEYEVENTF_KEYUP, 0)
+                win32api.keybd_event(vk_code, 0, self._win32con_keyup, 0)
                 return True
             else:
                 return False